@@ -5,9 +5,13 @@ from .album import *
 from .artist import *
 from .asset import *
 from .auth import *
+from .cache import *
 from .client import *
+from .endpoints import *
 from .exceptions import *
+from .iterators import *
 from .playlist import *
+from .ratelimit import *
 from .scopes import *
 from .track import *
 from .user import *
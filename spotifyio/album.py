@@ -1,15 +1,16 @@
 from datetime import date
-from typing import TYPE_CHECKING, List, Literal
+from typing import TYPE_CHECKING, List, Literal, Optional
 
-from .asset import Asset
-from .iterators import GenericAsyncIterator
+from .endpoints import ENDPOINTS
+from .iterators import PaginatedAsyncIterator
 from .mixins import Url
 from .types import SpotifyID, SpotifyURI
-from .utils.paginator import Paginator
+from .utils.lazy import build_assets, build_objects, lazy
 from .utils.time import fromspotifyiso
 
 if TYPE_CHECKING:
     from .artist import Artist
+    from .asset import Asset
     from .state import State
     from .track import Track
     from .types import AlbumPayload, ListAlbumPayload
@@ -46,9 +47,9 @@ class Album(Url):
         "external_urls",
         "name",
         "type",
-        "artists",
+        "_artists",
         "available_markets",
-        "images",
+        "_images",
         "release_date",
         "total_tracks",
         "copyrights",
@@ -64,9 +65,7 @@ class Album(Url):
         external_urls: dict
         name: str
         type: Literal["album", "single", "compilation"]
-        artists: List[Artist]
         markets: List[str]
-        images: List[Asset]
         release_date: date
         total_tracks: int
         copyrights: List[dict]
@@ -75,6 +74,9 @@ class Album(Url):
         label: str
         popularity: int
 
+    artists: "lazy[List[Artist]]" = lazy(build_objects)
+    images: "lazy[List[Asset]]" = lazy(build_assets)
+
     def __init__(self, state, data: "AlbumPayload") -> None:
         self._state: State = state
         self._update(data)
@@ -85,8 +87,8 @@ class Album(Url):
         self.external_urls = data["external_urls"]
         self.name = data["name"]
         self.type = data["album_type"]
-        self.artists = [self._state.objectify(a) for a in data["artists"]]
-        self.images = [Asset(**a) for a in data["images"]]
+        self.artists = data["artists"]
+        self.images = data["images"]
 
         # implement custom type for this mayhaps?
         release_date = data["release_date"]
@@ -108,18 +110,24 @@ class Album(Url):
         self.label = data.get("label")
         self.popularity = data.get("popularity")
 
-    def tracks(self) -> GenericAsyncIterator["Track"]:
+    def tracks(self, raw: Optional[bool] = None) -> PaginatedAsyncIterator["Track"]:
         """An asynchronous iterator for the album Tracks.
 
+        Args:
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
+
         Yields:
             :class:`.Track`:.
         """
 
-        async def gen():
-            async for data in Paginator(self._state.http.get_album_tracks, self.id, _data=self._tracks):
-                yield self._state.objectify(data)
-
-        return GenericAsyncIterator(gen())
+        return PaginatedAsyncIterator(
+            self._state,
+            self._state.http.get_album_tracks,
+            self.id,
+            _data=self._tracks,
+            page_size=ENDPOINTS["get_album_tracks"].max_page,
+            raw=raw,
+        )
 
     async def fetch(self) -> None:
         """Updates a partial of this object with all data"""
@@ -1,13 +1,14 @@
-from typing import TYPE_CHECKING, List, Literal
+from typing import TYPE_CHECKING, List, Literal, Optional
 
-from .asset import Asset
-from .iterators import GenericAsyncIterator
+from .endpoints import ENDPOINTS
+from .iterators import GenericAsyncIterator, PaginatedAsyncIterator
 from .mixins import Followable, Url
 from .types import SpotifyID, SpotifyURI
-from .utils.paginator import Paginator
+from .utils.lazy import build_assets, lazy
 
 if TYPE_CHECKING:
     from .album import Album
+    from .asset import Asset
     from .state import State
     from .track import Track
     from .types import ArtistPayload
@@ -37,7 +38,7 @@ class Artist(Url, Followable):
         "external_urls",
         "name",
         "genres",
-        "images",
+        "_images",
         "popularity",
     )
 
@@ -47,9 +48,10 @@ class Artist(Url, Followable):
         external_urls: dict
         name: str
         genres: List[str]
-        images: List[Asset]
         popularity: int
 
+    images: "lazy[List[Asset]]" = lazy(build_assets)
+
     def __init__(self, state, data: "ArtistPayload") -> None:
         self._state: State = state
         self._update(data)
@@ -63,10 +65,7 @@ class Artist(Url, Followable):
         self._followers = data.get("followers")
         self.genres = data.get("genres")
 
-        if "images" in data:
-            self.images = [Asset(**a) for a in data["images"]]
-        else:
-            self.images = None
+        self.images = data.get("images")
 
         self.popularity = data.get("popularity")
 
@@ -78,45 +77,58 @@ class Artist(Url, Followable):
             "appears_on",
             "compilation",
         ],
-    ) -> GenericAsyncIterator["Album"]:
+        raw: Optional[bool] = None,
+    ) -> PaginatedAsyncIterator["Album"]:
         """An asynchronous iterator for the artist's albums.
 
         Args:
             include (List[Literal["album", "single", "appears_on", "compilation"]]): the types of albums to return, default returns all.
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
 
         Yields:
             :class:`.Album`:.
         """
 
-        async def gen():
-            async for data in Paginator(self._state.http.get_artist_albums, self.id, include=include):
-                yield self._state.objectify(data)
-
-        return GenericAsyncIterator(gen())
+        return PaginatedAsyncIterator(
+            self._state,
+            self._state.http.get_artist_albums,
+            self.id,
+            include=include,
+            page_size=ENDPOINTS["get_artist_albums"].max_page,
+            raw=raw,
+        )
 
-    def top_tracks(self, country: str = "US") -> GenericAsyncIterator["Track"]:
+    def top_tracks(self, country: str = "US", raw: Optional[bool] = None) -> GenericAsyncIterator["Track"]:
         """An asynchronous iterator for the artist's top tracks.
 
+        Args:
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
+
         Yields:
             :class:`.Track`:.
         """
+        objectify = self._state.objectifier(raw)
 
         async def gen():
             for data in await self._state.http.get_artist_top_tracks(self.id, country_code=country):
-                yield self._state.objectify(data)
+                yield objectify(data)
 
         return GenericAsyncIterator(gen())
 
-    def related(self) -> GenericAsyncIterator["Artist"]:
+    def related(self, raw: Optional[bool] = None) -> GenericAsyncIterator["Artist"]:
         """An asynchronous iterator for related artists.
 
+        Args:
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
+
         Yields:
             :class:`.Artist`:.
         """
+        objectify = self._state.objectifier(raw)
 
         async def gen():
             for data in await self._state.http.get_artist_related(self.id):
-                yield self._state.objectify(data)
+                yield objectify(data)
 
         return GenericAsyncIterator(gen())
 
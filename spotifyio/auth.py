@@ -1,10 +1,13 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
+from itertools import cycle
 from secrets import token_urlsafe
-from typing import Iterable
+from typing import Iterable, List, Literal, Optional, Union
 from urllib.parse import parse_qsl, urlencode, urlparse
 
-from aiohttp import BasicAuth, ClientSession
+from aiohttp import BaseConnector, BasicAuth, ClientSession
 
+from .ratelimit import RateLimiter
 from .scopes import Scopes
 
 
@@ -19,6 +22,7 @@ class Token:
         self.access_token = access_token
         self.refresh_token = refresh_token
 
+        self.expires_in = expires_in
         self.expires_at: datetime = datetime.now(tz=timezone.utc) + timedelta(seconds=expires_in)
 
     @classmethod
@@ -31,28 +35,70 @@ class Token:
 
     @property
     def expired(self):
-        return self.access_token is None or self.expires_at <= datetime.now(tz=timezone.utc)
+        return self.expires_within(0)
+
+    def expires_within(self, seconds: float) -> bool:
+        """Whether the token is expired or will expire in the next ``seconds`` seconds."""
+        return self.access_token is None or self.expires_at - timedelta(seconds=seconds) <= datetime.now(tz=timezone.utc)
 
 
 class AuthorizationFlow:
     client_id: str
     client_secret: str
     token: Token = None
+    connector: Optional[BaseConnector] = None
+    ratelimiter: Optional[RateLimiter] = None
+
+    _refresh_task: Optional[asyncio.Task] = None
+    _session: Optional[ClientSession] = None
+    _in_flight: int = 0
+
+    def _select(self) -> "AuthorizationFlow":
+        return self
 
     async def _get_access_token(self):
         if not self.token or self.token.expired:
-            await self._update_token()
+            await self._refresh()
 
         return self.token.access_token
 
+    async def _refresh(self, stale: Optional[str] = None) -> None:
+        # the token that was rejected has already been replaced by someone else
+        if self._refresh_task is None and stale is not None and self.token and self.token.access_token != stale:
+            return
+
+        # only one refresh is ever in flight, everyone else waits on it
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._update_token())
+            self._refresh_task.add_done_callback(self._refresh_done)
+
+        # a cancelled caller shouldn't cancel the refresh for everyone else
+        await asyncio.shield(self._refresh_task)
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        self._refresh_task = None
+
     async def _api_token(self, **kwargs) -> dict:
-        async with ClientSession(raise_for_status=True) as session:
-            async with session.post(
-                "https://accounts.spotify.com/api/token",
-                auth=BasicAuth(self.client_id, self.client_secret),
-                **kwargs,
-            ) as r:
-                return await r.json()
+        # kept open between calls so refreshes reuse the same connection pool
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=self.connector,
+                connector_owner=self.connector is None,
+                raise_for_status=True,
+            )
+
+        async with self._session.post(
+            "https://accounts.spotify.com/api/token",
+            auth=BasicAuth(self.client_id, self.client_secret),
+            **kwargs,
+        ) as r:
+            return await r.json()
+
+    async def close(self) -> None:
+        """Closes the session used to talk to the accounts service, a shared ``connector`` is left open."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def _token_refresh(self) -> None:
         data = await self._api_token(
@@ -79,12 +125,16 @@ class AuthorizationCodeFlow(AuthorizationFlow):
         redirect_uri: str,
         scopes: Scopes | Iterable[str],
         token: Token = None,
+        connector: BaseConnector = None,
+        ratelimiter: RateLimiter = None,
     ) -> None:
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
         self.scopes = scopes
         self.token = token
+        self.connector = connector
+        self.ratelimiter = ratelimiter
 
     @property
     def url(self) -> str:
@@ -134,4 +184,75 @@ class AuthorizationCodeFlow(AuthorizationFlow):
             await self._token_refresh()
 
 
-FLOWS = AuthorizationCodeFlow
+class ClientCredentialsFlow(AuthorizationFlow):
+    """App-only authorization, no user context so only catalog endpoints can be used.
+
+    Args:
+        client_id (:class:`str`): The app's client ID.
+        client_secret (:class:`str`): The app's client secret.
+        token (Optional[:class:`.Token`]): An existing token to start with.
+        connector (Optional[:class:`aiohttp.BaseConnector`]): Connector shared with other flows for token requests.
+        ratelimiter (Optional[:class:`.RateLimiter`]): Governor for requests made with this app's token.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        token: Token = None,
+        connector: BaseConnector = None,
+        ratelimiter: RateLimiter = None,
+    ) -> None:
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.token = token
+        self.connector = connector
+        self.ratelimiter = ratelimiter
+
+    async def _update_token(self) -> None:
+        data = await self._api_token(data={"grant_type": "client_credentials"})
+
+        self.token = Token(**data, refresh_token=None)
+
+
+class CredentialPool:
+    """Spreads requests over several app registrations, each with its own token and rate budget.
+
+    Meant for :class:`.ClientCredentialsFlow`, requests can be served by any app in the pool
+    so it should only be used for catalog endpoints.
+
+    Args:
+        \*flows (:class:`.ClientCredentialsFlow`): The apps to spread requests over.
+        strategy (Literal["round_robin", "least_loaded"]): How the app for each request is picked,
+            ``least_loaded`` picks the app with the fewest requests in flight. Defaults to ``round_robin``.
+    """
+
+    def __init__(
+        self,
+        *flows: AuthorizationFlow,
+        strategy: Literal["round_robin", "least_loaded"] = "round_robin",
+    ) -> None:
+        if not flows:
+            raise ValueError("CredentialPool requires at least one flow")
+
+        self.flows: List[AuthorizationFlow] = list(flows)
+        self.strategy = strategy
+
+        self._cycle = cycle(self.flows)
+
+    @property
+    def token(self) -> Optional[Token]:
+        return self.flows[0].token
+
+    def _select(self) -> AuthorizationFlow:
+        if self.strategy == "least_loaded":
+            return min(self.flows, key=lambda flow: flow._in_flight)
+
+        return next(self._cycle)
+
+    async def close(self) -> None:
+        for flow in self.flows:
+            await flow.close()
+
+
+FLOWS = Union[AuthorizationCodeFlow, ClientCredentialsFlow, CredentialPool]
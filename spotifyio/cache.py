@@ -0,0 +1,291 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+import orjson
+
+from .endpoints import ENDPOINTS, HOUR
+
+if TYPE_CHECKING:
+    from .http import Route
+
+__all__ = ("ResponseCache", "SQLiteCache")
+
+
+class ResponseCache:
+    """An in-memory LRU cache for GET responses.
+
+    Routes are cached by their path template, only templates with a TTL are cached at all.
+    Responses that came with an ``ETag`` are kept after they expire and revalidated with
+    ``If-None-Match``, a ``304 Not Modified`` reuses the stored response and counts as a hit.
+    Responses are stored serialized, every hit returns a new copy the caller is free to modify.
+
+    Args:
+        maxsize (:class:`int`): Maximum number of responses kept, the least recently used is evicted first.
+            Defaults to 10000.
+        ttls (Optional[Dict[:class:`str`, :class:`float`]]): Seconds to keep responses for, by route template.
+            Merged over :attr:`DEFAULT_TTLS`, a TTL of ``None`` disables caching for that template.
+
+    Attributes:
+        hits (:class:`int`): Number of lookups answered from the cache.
+        misses (:class:`int`): Number of lookups for cacheable routes that weren't in the cache.
+    """
+
+    DEFAULT_TTLS: Dict[str, Optional[float]] = {
+        e.path: e.ttl for e in ENDPOINTS.values() if e.method == "GET" and e.ttl is not None
+    }
+
+    def __init__(self, maxsize: int = 10000, ttls: Optional[Dict[str, Optional[float]]] = None) -> None:
+        self.maxsize = maxsize
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._data: OrderedDict[Tuple[Hashable, ...], Tuple[float, bytes, Optional[str]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def cacheable(self, route: "Route") -> bool:
+        return route.method == "GET" and self.ttls.get(route.path) is not None
+
+    def get(self, route: "Route") -> Optional[Any]:
+        """Returns the cached response for the route, or ``None``."""
+        if not self.cacheable(route):
+            return None
+
+        key = route.key
+
+        try:
+            expires, data, etag = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        if expires <= time.monotonic():
+            # without an etag there is no way to revalidate it
+            if etag is None:
+                del self._data[key]
+
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+
+        return orjson.loads(data)
+
+    def etag(self, route: "Route") -> Optional[str]:
+        """Returns the ETag stored with the route's response, or ``None``."""
+        if not self.cacheable(route):
+            return None
+
+        try:
+            return self._data[route.key][2]
+        except KeyError:
+            return None
+
+    def revalidate(self, route: "Route") -> Optional[Any]:
+        """Marks the stored response as fresh again after a ``304`` and returns it."""
+        key = route.key
+
+        try:
+            _, data, etag = self._data[key]
+        except KeyError:
+            return None
+
+        self._data[key] = (time.monotonic() + self.ttls[route.path], data, etag)
+        self._data.move_to_end(key)
+
+        # the lookup before the request counted as a miss
+        self.misses -= 1
+        self.hits += 1
+
+        return orjson.loads(data)
+
+    def set(self, route: "Route", data: Any, etag: Optional[str] = None) -> None:
+        if data is None or not self.cacheable(route):
+            return
+
+        ttl = self.ttls[route.path]
+
+        # would never be served, nothing to revalidate it with either
+        if ttl <= 0 and etag is None:
+            return
+
+        key = route.key
+
+        self._data[key] = (time.monotonic() + ttl, orjson.dumps(data), etag)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class SQLiteCache:
+    """A persistent cache for GET responses stored in an SQLite database.
+
+    Consulted after the in-memory :class:`.ResponseCache` and before the network, so a restarted
+    process starts warm. Reads and writes run in a worker thread, writes are buffered and
+    committed in batches. Responses are serialized when they are buffered and decoded on every
+    read, so callers never share them.
+
+    There are no ETags to revalidate with, so playlists, which the in-memory cache revalidates
+    on every use, are kept for an hour by default and may be that stale. Pass a TTL of ``None``
+    for their templates in ``ttls`` to keep them off the disk.
+
+    Args:
+        path (:class:`str`): Path to the database file, created if it doesn't exist.
+        maxsize (:class:`int`): Maximum number of responses kept, those closest to expiring are evicted first.
+            Defaults to 1000000.
+        ttls (Optional[Dict[:class:`str`, :class:`float`]]): Seconds to keep responses for, by route template.
+            Merged over :attr:`DEFAULT_TTLS`, templates without a positive TTL aren't stored.
+        batch_size (:class:`int`): Number of buffered writes that triggers a commit. Defaults to 500.
+        flush_interval (:class:`float`): Seconds a write may stay buffered before it is committed. Defaults to 5.
+
+    Attributes:
+        hits (:class:`int`): Number of lookups answered from the database.
+        misses (:class:`int`): Number of lookups for cacheable routes that weren't in the database.
+    """
+
+    # the in-memory TTLs, with an hour for the templates it always revalidates
+    DEFAULT_TTLS: Dict[str, Optional[float]] = {path: ttl or HOUR for path, ttl in ResponseCache.DEFAULT_TTLS.items()}
+
+    def __init__(
+        self,
+        path: str,
+        maxsize: int = 1000000,
+        ttls: Optional[Dict[str, Optional[float]]] = None,
+        batch_size: int = 500,
+        flush_interval: float = 5,
+    ) -> None:
+        self.path = path
+        self.maxsize = maxsize
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._writes: List[Tuple[str, bytes, float]] = []
+        self._flusher: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+        self._conn: sqlite3.Connection = None
+        self._conn_lock = threading.Lock()
+
+    def cacheable(self, route: "Route") -> bool:
+        return route.method == "GET" and (self.ttls.get(route.path) or 0) > 0
+
+    @staticmethod
+    def _key(route: "Route") -> str:
+        return orjson.dumps(route.key).decode()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, data BLOB, expires REAL)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)")
+
+        return self._conn
+
+    def _read(self, keys: List[str]) -> Dict[str, Any]:
+        with self._conn_lock:
+            conn = self._connect()
+
+            placeholders = ",".join("?" * len(keys))
+            rows = conn.execute(
+                f"SELECT key, data FROM responses WHERE key IN ({placeholders}) AND expires > ?", (*keys, time.time())
+            )
+
+            return {key: orjson.loads(data) for key, data in rows}
+
+    def _write(self, writes: List[Tuple[str, bytes, float]]) -> None:
+        with self._conn_lock:
+            conn = self._connect()
+
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO responses (key, data, expires) VALUES (?, ?, ?)", writes)
+                conn.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+                conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY expires LIMIT max((SELECT count(*) FROM responses) - ?, 0))",
+                    (self.maxsize,),
+                )
+
+    async def get_many(self, routes: Sequence["Route"]) -> List[Optional[Any]]:
+        """Returns the stored response for each route, ``None`` for those that aren't stored."""
+        keys = {route: self._key(route) for route in routes if self.cacheable(route)}
+
+        found = await asyncio.to_thread(self._read, list(keys.values())) if keys else {}
+
+        results = []
+        for route in routes:
+            if route not in keys:
+                results.append(None)
+                continue
+
+            data = found.get(keys[route])
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+            results.append(data)
+
+        return results
+
+    async def get(self, route: "Route") -> Optional[Any]:
+        """Returns the stored response for the route, or ``None``."""
+        return (await self.get_many([route]))[0]
+
+    def set(self, route: "Route", data: Any) -> None:
+        """Buffers a response to be written with the next batch."""
+        if data is None or not self.cacheable(route):
+            return
+
+        # serialized now, the caller may modify data before the batch is written
+        self._writes.append((self._key(route), orjson.dumps(data), time.time() + self.ttls[route.path]))
+
+        if len(self._writes) >= self.batch_size:
+            self._flush()
+        elif self._flusher is None:
+            self._flusher = asyncio.get_running_loop().call_later(self.flush_interval, self._flush)
+
+    def _flush(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+
+        if not self._writes:
+            return
+
+        writes, self._writes = self._writes, []
+
+        task = asyncio.ensure_future(asyncio.to_thread(self._write, writes))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def flush(self) -> None:
+        """Writes every buffered response to the database."""
+        self._flush()
+
+        if self._flushes:
+            await asyncio.gather(*self._flushes)
+
+    async def close(self) -> None:
+        await self.flush()
+
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,24 +1,55 @@
 import asyncio
+from datetime import datetime, timezone
 from types import TracebackType
 from typing import Any, List, Optional, Type
 
 from .album import Album
 from .artist import Artist
-from .auth import FLOWS, Token
+from .auth import FLOWS, AuthorizationFlow, CredentialPool, Token
+from .endpoints import ENDPOINTS
 from .http import HTTPClient
-from .iterators import GenericAsyncIterator
+from .iterators import GenericAsyncIterator, PaginatedAsyncIterator
 from .playlist import Playlist
 from .state import State
 from .track import Track
 from .types import SpotifyID, SpotifyUserID
 from .user import ClientUser, User
-from .utils.chunked import Chunked
-from .utils.paginator import Paginator
+from .utils.chunked import batched
+from .utils.concurrency import map_concurrent
 
 
 class Client:
     """SpotifyIO Client object that is used to interact with the Spotify API.
 
+    Args:
+        auth_flow: The authorization flow used to get tokens.
+        ratelimiter (Optional[:class:`.RateLimiter`]): Governor acquired before every request,
+            can be shared between clients. Defaults to ``None``.
+        refresh_ahead (Optional[:class:`float`]): If set, the token is refreshed in the background
+            this many seconds before it expires, at most half the token's lifetime. Defaults to ``None``.
+        page_prefetch (:class:`int`): Number of pages paginated iterators request concurrently
+            ahead of the one being read, items are still yielded in order. Slices request up to this
+            many pages at once, at least four. Defaults to ``0``.
+        coalesce (Optional[:class:`float`]): If set, single album, artist and track lookups made within
+            this many seconds of each other are sent as one multiple-id request. Defaults to ``None``.
+        dedupe (:class:`bool`): Identical GET requests made while one is already in flight share
+            its response instead of being sent again. Defaults to ``True``.
+        cache (Optional[:class:`.ResponseCache`]): Cache consulted before sending GET requests. Defaults to ``None``.
+        disk_cache (Optional[:class:`.SQLiteCache`]): Persistent cache consulted after ``cache`` and before
+            the network. Defaults to ``None``.
+        identity_map (:class:`bool`): Reuse one object per album, artist, playlist, track and user id,
+            updating it in place when a fuller payload arrives. Defaults to ``False``.
+        lazy (:class:`bool`): Keep nested payloads such as a track's album or an album's artists as is
+            and only turn them into objects when first accessed. Defaults to ``False``.
+        raw (:class:`bool`): Fetch methods and iterators return the payload dicts as received instead of
+            building objects, can be overridden per call. Each call gets its own copy of a response, items
+            embedded in a parent object, like the first tracks of a playlist, are that object's own payload
+            and shouldn't be modified. Defaults to ``False``.
+        decode_threshold (Optional[:class:`int`]): If set, response bodies of at least this many bytes are
+            parsed in ``decode_executor`` instead of on the event loop. Defaults to ``None``.
+        decode_executor (Optional[:class:`concurrent.futures.Executor`]): Executor large bodies are parsed in,
+            ``None`` uses the loop's default executor. Defaults to ``None``.
+
     Attributes:
         token (Optional[:class:`.Token`]): The current auth token. Could be ``None``.
     """
@@ -29,9 +60,25 @@ class Client:
         self._http = HTTPClient(
             self._loop,
             auth_flow,
+            ratelimiter=options.get("ratelimiter"),
+            coalesce=options.get("coalesce"),
+            dedupe=options.get("dedupe", True),
+            cache=options.get("cache"),
+            disk_cache=options.get("disk_cache"),
+            decode_threshold=options.get("decode_threshold"),
+            decode_executor=options.get("decode_executor"),
+        )
+
+        self._state = State(
+            self._http,
+            page_prefetch=options.get("page_prefetch", 0),
+            identity_map=options.get("identity_map", False),
+            lazy=options.get("lazy", False),
+            raw=options.get("raw", False),
         )
 
-        self._state = State(self._http)
+        self._refresh_ahead: Optional[float] = options.get("refresh_ahead")
+        self._refreshers: List[asyncio.Task] = []
 
     async def __aenter__(self):
         await self.prepare()
@@ -40,6 +87,12 @@ class Client:
     async def prepare(self) -> None:
         await self._http.prepare()
 
+        if self._refresh_ahead is not None:
+            auth = self._http.auth
+            flows = auth.flows if isinstance(auth, CredentialPool) else [auth]
+
+            self._refreshers = [self._loop.create_task(self._refresh_loop(flow, self._refresh_ahead)) for flow in flows]
+
     async def __aexit__(
         self,
         exc_type: Optional[Type[BaseException]],
@@ -49,8 +102,38 @@ class Client:
         await self.close()
 
     async def close(self) -> None:
+        for refresher in self._refreshers:
+            refresher.cancel()
+
+        await asyncio.gather(*self._refreshers, return_exceptions=True)
+        self._refreshers = []
+
         await self._http.close()
 
+    async def _refresh_loop(self, auth: AuthorizationFlow, skew: float) -> None:
+        while True:
+            if auth.token is None:
+                # nothing to refresh until the first request has authorized us
+                await asyncio.sleep(1)
+                continue
+
+            # refreshing more than halfway through the token's lifetime would never let it settle
+            ahead = min(skew, auth.token.expires_in / 2)
+
+            delay = (auth.token.expires_at - datetime.now(tz=timezone.utc)).total_seconds() - ahead
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            try:
+                await auth._refresh()
+            except Exception:
+                # requests will still refresh on their own if this keeps failing
+                pass
+
+            # don't spin if refreshing keeps failing
+            await asyncio.sleep(1)
+
     @property
     def token(self) -> Token:
         return self._http.auth.token
@@ -59,11 +142,12 @@ class Client:
         """:class:`.ClientUser`: Retrieves the currently authenticated user"""
         return ClientUser(self._state, await self._http.get_me())
 
-    async def fetch_album(self, album_id: SpotifyID) -> Album:
+    async def fetch_album(self, album_id: SpotifyID, raw: Optional[bool] = None) -> Album:
         """Retrieve an album with the given ID.
 
         Args:
             album_id (:class:`str`): The album's ID to fetch
+            raw (Optional[:class:`bool`]): Return payload dicts instead of objects. Defaults to the client's ``raw`` option.
 
         Raises:
             HTTPException: Retrieving the album failed.
@@ -71,13 +155,20 @@ class Client:
         Returns:
             :class:`.Album`: The album from the ID.
         """
-        return self._state.objectify(await self._http.get_album(album_id))
+        return self._state.objectifier(raw)(await self._http.get_album(album_id))
 
-    def fetch_albums(self, *album_ids: List[SpotifyID]) -> GenericAsyncIterator[Album]:
+    def fetch_albums(
+        self, *album_ids: List[SpotifyID], concurrency: int = 4, ordered: bool = True, raw: Optional[bool] = None
+    ) -> GenericAsyncIterator[Album]:
         """An asynchronous iterator for multiple Albums.
 
         Args:
-            \*album_ids (:class:`str`): Argument list of album ids
+            \*album_ids (:class:`str`): Argument list of album ids, or a single iterable, async iterable or
+                :class:`.Batched` of them, which is read in batches as they are sent.
+            concurrency (:class:`int`): Maximum number of batch requests in flight. Defaults to 4.
+            ordered (:class:`bool`): Yield albums in the order they were given, otherwise as soon as
+                their batch arrives. Defaults to ``True``.
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
 
         Raises:
             HTTPException: Retrieving the album failed.
@@ -86,18 +177,25 @@ class Client:
             :class:`.Album`: An Album.
         """
 
+        objectify = self._state.objectifier(raw)
+
         async def gen():
-            for chunk in Chunked(album_ids, 50):
-                for album in await self._http.get_albums(chunk):
-                    yield self._state.objectify(album)
+            batches = map_concurrent(
+                self._http.get_albums, batched(album_ids, ENDPOINTS["get_albums"].max_ids), concurrency, ordered
+            )
+
+            async for batch in batches:
+                for album in batch:
+                    yield objectify(album)
 
         return GenericAsyncIterator(gen())
 
-    async def fetch_artist(self, artist_id: SpotifyID) -> Artist:
+    async def fetch_artist(self, artist_id: SpotifyID, raw: Optional[bool] = None) -> Artist:
         """Retrieve an artist with the given ID.
 
         Args:
             artist_id (:class:`str`): The artist's ID to fetch
+            raw (Optional[:class:`bool`]): Return payload dicts instead of objects. Defaults to the client's ``raw`` option.
 
         Raises:
             HTTPException: Retrieving the album failed.
@@ -105,13 +203,20 @@ class Client:
         Returns:
             :class:`.Artist`: The artist from the ID.
         """
-        return self._state.objectify(await self._http.get_artist(artist_id))
+        return self._state.objectifier(raw)(await self._http.get_artist(artist_id))
 
-    def fetch_artists(self, *artist_ids: List[SpotifyID]) -> GenericAsyncIterator[Artist]:
+    def fetch_artists(
+        self, *artist_ids: List[SpotifyID], concurrency: int = 4, ordered: bool = True, raw: Optional[bool] = None
+    ) -> GenericAsyncIterator[Artist]:
         """An asynchronous iterator for multiple Artists.
 
         Args:
-            \*artist_ids (:class:`str`): Argument list of artist ids
+            \*artist_ids (:class:`str`): Argument list of artist ids, or a single iterable, async iterable or
+                :class:`.Batched` of them, which is read in batches as they are sent.
+            concurrency (:class:`int`): Maximum number of batch requests in flight. Defaults to 4.
+            ordered (:class:`bool`): Yield artists in the order they were given, otherwise as soon as
+                their batch arrives. Defaults to ``True``.
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
 
         Raises:
             HTTPException: Retrieving the artist failed.
@@ -120,18 +225,25 @@ class Client:
             :class:`.Artist`: An Artist.
         """
 
+        objectify = self._state.objectifier(raw)
+
         async def gen():
-            for chunk in Chunked(artist_ids, 50):
-                for artist in await self._http.get_artists(chunk):
-                    yield self._state.objectify(artist)
+            batches = map_concurrent(
+                self._http.get_artists, batched(artist_ids, ENDPOINTS["get_artists"].max_ids), concurrency, ordered
+            )
+
+            async for batch in batches:
+                for artist in batch:
+                    yield objectify(artist)
 
         return GenericAsyncIterator(gen())
 
-    async def fetch_track(self, track_id: SpotifyID) -> Track:
+    async def fetch_track(self, track_id: SpotifyID, raw: Optional[bool] = None) -> Track:
         """Retrieve a track with the given ID.
 
         Args:
             track_id (:class:`str`): The track's ID to fetch
+            raw (Optional[:class:`bool`]): Return payload dicts instead of objects. Defaults to the client's ``raw`` option.
 
         Raises:
             HTTPException: Retrieving the track failed.
@@ -139,15 +251,22 @@ class Client:
         Returns:
             :class:`.Track`: The track from the ID.
         """
-        return self._state.objectify(await self._http.get_track(track_id))
+        return self._state.objectifier(raw)(await self._http.get_track(track_id))
 
-    def fetch_tracks(self, *track_ids: List[SpotifyID]) -> GenericAsyncIterator[Track]:
+    def fetch_tracks(
+        self, *track_ids: List[SpotifyID], concurrency: int = 4, ordered: bool = True, raw: Optional[bool] = None
+    ) -> GenericAsyncIterator[Track]:
         """An asynchronous iterator for multiple Tracks.
 
         .. :async-for:
 
         Args:
-            \*track_ids (:class:`str`): Argument list of track ids
+            \*track_ids (:class:`str`): Argument list of track ids, or a single iterable, async iterable or
+                :class:`.Batched` of them, which is read in batches as they are sent.
+            concurrency (:class:`int`): Maximum number of batch requests in flight. Defaults to 4.
+            ordered (:class:`bool`): Yield tracks in the order they were given, otherwise as soon as
+                their batch arrives. Defaults to ``True``.
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
 
         Raises:
             HTTPException: Retrieving the track failed.
@@ -156,18 +275,25 @@ class Client:
             :class:`.Track`: A Track.
         """
 
+        objectify = self._state.objectifier(raw)
+
         async def gen():
-            for chunk in Chunked(track_ids, 50):
-                for track in await self._http.get_tracks(chunk):
-                    yield self._state.objectify(track)
+            batches = map_concurrent(
+                self._http.get_tracks, batched(track_ids, ENDPOINTS["get_tracks"].max_ids), concurrency, ordered
+            )
+
+            async for batch in batches:
+                for track in batch:
+                    yield objectify(track)
 
         return GenericAsyncIterator(gen())
 
-    async def fetch_user(self, user_id: SpotifyUserID) -> User:
+    async def fetch_user(self, user_id: SpotifyUserID, raw: Optional[bool] = None) -> User:
         """Retrieve a user with the given ID.
 
         Args:
             user_id (:class:`str`): The user's ID to fetch
+            raw (Optional[:class:`bool`]): Return payload dicts instead of objects. Defaults to the client's ``raw`` option.
 
         Raises:
             HTTPException: Retrieving the user failed.
@@ -175,13 +301,14 @@ class Client:
         Returns:
             :class:`.User`: The user from the ID.
         """
-        return self._state.objectify(await self._http.get_user(user_id))
+        return self._state.objectifier(raw)(await self._http.get_user(user_id))
 
-    async def fetch_playlist(self, playlist_id: SpotifyID) -> Playlist:
+    async def fetch_playlist(self, playlist_id: SpotifyID, raw: Optional[bool] = None) -> Playlist:
         """Retrieve a playlist with the given ID.
 
         Args:
             playlist_id (:class:`str`): The playlist's ID to fetch
+            raw (Optional[:class:`bool`]): Return payload dicts instead of objects. Defaults to the client's ``raw`` option.
 
         Raises:
             HTTPException: Retrieving the playlist failed.
@@ -189,30 +316,40 @@ class Client:
         Returns:
             :class:`.Playlist`: The playlist from the ID.
         """
-        return self._state.objectify(await self._http.get_playlist(playlist_id))
+        return self._state.objectifier(raw)(await self._http.get_playlist(playlist_id))
 
-    def new_album_releases(self, country: str = None) -> GenericAsyncIterator[Album]:
+    def new_album_releases(self, country: str = None, raw: Optional[bool] = None) -> PaginatedAsyncIterator[Album]:
         """An asynchronous iterator for new Album releases.
 
+        Args:
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
+
         Yields:
             :class:`.Album`: An Album.
         """
 
-        async def gen():
-            async for data in Paginator(self._http.get_browse_new_releases, country_code=country):
-                yield self._state.objectify(data)
-
-        return GenericAsyncIterator(gen())
+        return PaginatedAsyncIterator(
+            self._state,
+            self._http.get_browse_new_releases,
+            country_code=country,
+            page_size=ENDPOINTS["get_browse_new_releases"].max_page,
+            raw=raw,
+        )
 
-    def featured_playlists(self, country: str = None) -> GenericAsyncIterator[Playlist]:
+    def featured_playlists(self, country: str = None, raw: Optional[bool] = None) -> PaginatedAsyncIterator[Playlist]:
         """An asynchronous iterator for featured Playlists.
 
+        Args:
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
+
         Yields:
             :class:`.Playlist`: A Playlist.
         """
 
-        async def gen():
-            async for data in Paginator(self._http.get_browse_featured_playlists, country_code=country):
-                yield self._state.objectify(data)
-
-        return GenericAsyncIterator(gen())
+        return PaginatedAsyncIterator(
+            self._state,
+            self._http.get_browse_featured_playlists,
+            country_code=country,
+            page_size=ENDPOINTS["get_browse_featured_playlists"].max_page,
+            raw=raw,
+        )
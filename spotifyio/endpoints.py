@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+__all__ = ("Endpoint", "ENDPOINTS")
+
+DAY = 24 * 60 * 60
+HOUR = 60 * 60
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """What a Spotify API endpoint allows.
+
+    Attributes:
+        method (:class:`str`): The HTTP method.
+        path (:class:`str`): The path template, as passed to ``Route``.
+        max_ids (Optional[:class:`int`]): Most ids or uris accepted in one request.
+        max_page (Optional[:class:`int`]): Largest ``limit`` accepted by a paginated endpoint.
+        idempotent (:class:`bool`): If the request can safely be sent again after a server error.
+        ttl (Optional[:class:`float`]): Seconds a response may be cached for, ``None`` if it shouldn't be.
+    """
+
+    method: str
+    path: str
+    max_ids: Optional[int] = None
+    max_page: Optional[int] = None
+    idempotent: bool = True
+    ttl: Optional[float] = None
+
+
+# keyed by the HTTPClient method that calls the endpoint
+ENDPOINTS: Dict[str, Endpoint] = {
+    "fetch_me": Endpoint("GET", "/me"),
+    # Albums
+    "get_album": Endpoint("GET", "/albums/{album_id}", ttl=DAY),
+    "get_albums": Endpoint("GET", "/albums", max_ids=20),
+    "get_album_tracks": Endpoint("GET", "/albums/{album_id}/tracks", max_page=50, ttl=DAY),
+    "get_me_albums": Endpoint("GET", "/me/albums", max_page=50),
+    "put_me_albums": Endpoint("PUT", "/me/albums", max_ids=20),
+    "delete_me_albums": Endpoint("DELETE", "/me/albums", max_ids=20),
+    "get_me_albums_contains": Endpoint("GET", "/me/albums/contains", max_ids=20),
+    "get_browse_new_releases": Endpoint("GET", "/browse/new-releases", max_page=50),
+    # Artists
+    "get_artist": Endpoint("GET", "/artists/{artist_id}", ttl=HOUR),
+    "get_artists": Endpoint("GET", "/artists", max_ids=50),
+    "get_artist_albums": Endpoint("GET", "/artists/{artist_id}/albums", max_page=50, ttl=HOUR),
+    "get_artist_top_tracks": Endpoint("GET", "/artists/{artist_id}/top-tracks", ttl=HOUR),
+    "get_artist_related": Endpoint("GET", "/artists/{artist_id}/related-artists", ttl=HOUR),
+    # Tracks
+    "get_track": Endpoint("GET", "/tracks/{track_id}", ttl=DAY),
+    "get_tracks": Endpoint("GET", "/tracks", max_ids=50),
+    # Playlists, these change too often to cache without revalidating
+    "get_playlist": Endpoint("GET", "/playlists/{playlist_id}", ttl=0),
+    "put_playlist": Endpoint("PUT", "/playlists/{playlist_id}"),
+    "get_playlist_tracks": Endpoint("GET", "/playlists/{playlist_id}/tracks", max_page=100, ttl=0),
+    "post_playlist_tracks": Endpoint("POST", "/playlists/{playlist_id}/tracks", max_ids=100, idempotent=False),
+    "put_playlist_tracks": Endpoint("PUT", "/playlists/{playlist_id}/tracks", max_ids=100),
+    "delete_playlist_tracks": Endpoint("DELETE", "/playlists/{playlist_id}/tracks", max_ids=100),
+    "put_playlist_image": Endpoint("PUT", "/playlists/{playlist_id}/images"),
+    "get_me_playlists": Endpoint("GET", "/me/playlists", max_page=50),
+    "get_user_playlists": Endpoint("GET", "/users/{user_id}/playlists", max_page=50),
+    "post_user_playlists": Endpoint("POST", "/users/{user_id}/playlists", idempotent=False),
+    "get_browse_featured_playlists": Endpoint("GET", "/browse/featured-playlists", max_page=50),
+    "get_browse_category_playlists": Endpoint("GET", "/browse/categories/{category}/playlists", max_page=50),
+}
+
+# the same table by (method, path template), for looking up a Route
+ROUTES: Dict[Tuple[str, str], Endpoint] = {(e.method, e.path): e for e in ENDPOINTS.values()}
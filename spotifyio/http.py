@@ -1,14 +1,20 @@
 import asyncio
 import sys
 from base64 import b64encode
-from typing import Any, ClassVar, Dict, List, Optional
+from concurrent.futures import Executor
+from functools import partial
+from string import Formatter
+from typing import Any, ClassVar, Dict, Hashable, List, Optional, Tuple
 
 import aiohttp
 import orjson
 
 from . import __version__
-from .auth import FLOWS
+from .auth import FLOWS, AuthorizationFlow
+from .cache import ResponseCache, SQLiteCache
+from .endpoints import ENDPOINTS, ROUTES, Endpoint
 from .exceptions import Forbidden, HTTPException, NotFound, ServerError
+from .ratelimit import RateLimiter
 from .types import (
     AlbumPayload,
     ArtistPayload,
@@ -26,6 +32,14 @@ from .types import (
     TrackPayload,
     UserPayload,
 )
+from .utils.chunked import Chunked
+from .utils.coalescer import Coalescer
+from .utils.concurrency import Shared
+
+
+def _copy(data: Any) -> Any:
+    """A deep copy of a JSON payload, a round trip through orjson is faster than copy.deepcopy."""
+    return orjson.loads(orjson.dumps(data))
 
 
 class Route:
@@ -34,9 +48,26 @@ class Route:
     def __init__(self, method: str, path: str, **parameters: Dict[str, Any]) -> None:
         self.method = method
         self.path = path
-        self.url = self.BASE + self.path
 
-        self.query = parameters
+        # parameters named in the path template are formatted into it, the rest are sent as the query
+        fields = {name for _, name, _, _ in Formatter().parse(path) if name}
+
+        self.url = self.BASE + path.format_map({name: parameters[name] for name in fields})
+
+        self.query = {k: v for k, v in parameters.items() if k not in fields}
+
+    @property
+    def key(self) -> Tuple[Hashable, ...]:
+        """Identifies the resource this route points at, equal for routes that would send the same request."""
+        return (self.method, self.url, tuple(sorted((k, str(v)) for k, v in self.query.items())))
+
+    @property
+    def endpoint(self) -> Endpoint:
+        """What the endpoint allows, unknown endpoints are assumed idempotent unless they are POSTs."""
+        try:
+            return ROUTES[(self.method, self.path)]
+        except KeyError:
+            return Endpoint(self.method, self.path, idempotent=self.method != "POST")
 
 
 class HTTPClient:
@@ -45,47 +76,239 @@ class HTTPClient:
         loop: asyncio.AbstractEventLoop,
         auth: FLOWS,
         connector: Optional[aiohttp.BaseConnector] = None,
+        ratelimiter: Optional[RateLimiter] = None,
+        coalesce: Optional[float] = None,
+        dedupe: bool = True,
+        cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[SQLiteCache] = None,
+        decode_threshold: Optional[int] = None,
+        decode_executor: Optional[Executor] = None,
     ) -> None:
         self.loop = loop
         self.auth = auth
         self.connector = connector or None
+        self.ratelimiter = ratelimiter
+        self.dedupe = dedupe
+        self.cache = cache
+        self.disk_cache = disk_cache
+
+        # bodies at least this many bytes long are parsed in decode_executor, off the event loop
+        self.decode_threshold = decode_threshold
+        self.decode_executor = decode_executor
+
+        # GET requests currently being sent, identical requests wait on these instead
+        self._in_flight: Dict[Tuple[Hashable, ...], Shared[Any]] = {}
+
+        # single album/artist/track lookups get batched into the multiple-id endpoints
+        self._album_loader: Optional[Coalescer[SpotifyID, AlbumPayload]] = None
+        self._artist_loader: Optional[Coalescer[SpotifyID, ArtistPayload]] = None
+        self._track_loader: Optional[Coalescer[SpotifyID, TrackPayload]] = None
+
+        if coalesce is not None:
+            self._album_loader = Coalescer(
+                self.get_albums, self._get_album, ENDPOINTS["get_albums"].max_ids, coalesce, _copy
+            )
+            self._artist_loader = Coalescer(
+                self.get_artists, self._get_artist, ENDPOINTS["get_artists"].max_ids, coalesce, _copy
+            )
+            self._track_loader = Coalescer(
+                self.get_tracks, self._get_track, ENDPOINTS["get_tracks"].max_ids, coalesce, _copy
+            )
 
         self.__session: aiohttp.ClientSession = None
 
+        # one per app, cleared while we are waiting out a 429, every request waits on this before being sent
+        self._global_over: Dict[AuthorizationFlow, asyncio.Event] = {}
+
         self.user_agent = f"SpotifyIO (https://github.com/unex/SpotifyIO {__version__}) Python/{sys.version_info} aiohttp/{aiohttp.__version__}"
 
     async def request(
         self,
         route: Route,
         **kwargs: Any,
+    ) -> Any:
+        if route.method != "GET" or kwargs:
+            return await self._dispatch(route, **kwargs)
+
+        if self.cache is not None and (data := self.cache.get(route)) is not None:
+            return data
+
+        if not self.dedupe:
+            return await self._fetch(route)
+
+        key = route.key
+
+        shared = self._in_flight.get(key)
+        if shared is None:
+            task = asyncio.ensure_future(self._fetch(route))
+            shared = self._in_flight[key] = Shared(task, _copy)
+            task.add_done_callback(partial(self._request_done, key, shared))
+
+        # every caller gets its own copy, so one of them modifying it doesn't affect the others
+        return await shared.wait()
+
+    async def _fetch(self, route: Route) -> Any:
+        if self.disk_cache is not None and (data := await self.disk_cache.get(route)) is not None:
+            if self.cache is not None:
+                self.cache.set(route, data)
+
+            return data
+
+        return await self._dispatch(route)
+
+    async def _get_many(self, path: str, field: str, key: str, ids: List[SpotifyID]) -> List[Any]:
+        """Fetches objects from a multiple-id endpoint, only sending ids that aren't cached under their single-id route."""
+        if self.cache is None and self.disk_cache is None:
+            return await self._get_ids(path, key, ids)
+
+        routes = [Route("GET", f"{path}/{{{field}}}", **{field: id}) for id in ids]
+
+        if self.cache is not None:
+            results = [self.cache.get(route) for route in routes]
+        else:
+            results = [None] * len(routes)
+
+        if self.disk_cache is not None and None in results:
+            missing = [i for i, result in enumerate(results) if result is None]
+
+            for i, data in zip(missing, await self.disk_cache.get_many([routes[i] for i in missing])):
+                if data is not None:
+                    results[i] = data
+
+                    if self.cache is not None:
+                        self.cache.set(routes[i], data)
+
+        if missing := [id for id, result in zip(ids, results) if result is None]:
+            fetched = iter(await self._get_ids(path, key, missing))
+
+            for i, route in enumerate(routes):
+                if results[i] is None:
+                    results[i] = next(fetched)
+
+                    if self.cache is not None:
+                        self.cache.set(route, results[i])
+                    if self.disk_cache is not None:
+                        self.disk_cache.set(route, results[i])
+
+        return results
+
+    async def _get_ids(self, path: str, key: str, ids: List[SpotifyID]) -> List[Any]:
+        """Sends the ids to a multiple-id endpoint in as few requests as it allows."""
+        size = ROUTES[("GET", path)].max_ids
+
+        pages = await asyncio.gather(
+            *(self.request(Route("GET", path, ids=",".join(chunk))) for chunk in Chunked(ids, size))
+        )
+
+        return [data for page in pages for data in page[key]]
+
+    def _request_done(self, key: Tuple[Hashable, ...], shared: Shared[Any], task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is shared:
+            del self._in_flight[key]
+
+    async def _dispatch(
+        self,
+        route: Route,
+        **kwargs: Any,
+    ) -> Any:
+        auth = self.auth._select()
+
+        # counted from selection so least loaded pools see requests that are still waiting
+        auth._in_flight += 1
+        try:
+            return await self._request(auth, route, **kwargs)
+        finally:
+            auth._in_flight -= 1
+
+    async def _request(
+        self,
+        auth: AuthorizationFlow,
+        route: Route,
+        **kwargs: Any,
     ) -> Any:
         method = route.method
         url = route.url
 
-        token = await self.auth._get_access_token()
+        global_over = self._get_global_over(auth)
+
+        token = await auth._get_access_token()
 
         headers: Dict[str, str] = {
             "User-Agent": self.user_agent,
             "Authorization": f"Bearer {token}",
         }
 
+        # revalidate a stale cached copy instead of downloading it again
+        etag = None
+        if self.cache is not None and method == "GET" and (etag := self.cache.etag(route)):
+            headers["If-None-Match"] = etag
+
         kwargs["headers"] = headers
 
+        # a POST may have gone through before the server failed, sending it again could apply it twice
+        idempotent = route.endpoint.idempotent
+
+        reauthorized = False
+
         for tries in range(5):
+            await global_over.wait()
+
+            if self.ratelimiter is not None:
+                await self.ratelimiter.acquire()
+
+            if auth.ratelimiter is not None:
+                await auth.ratelimiter.acquire()
+
             try:
                 async with self.__session.request(method, url, params=route.query, **kwargs) as response:
-                    if text := await response.text():
-                        data = orjson.loads(text)
+                    # orjson parses bytes directly, no need to decode the body to a str first
+                    if response.status != 204 and (body := await response.read()):
+                        data = await self._decode(body)
                     else:
                         data = None
 
-                    # TODO: ratelimiting
+                    # Not modified, the cached copy is still good
+                    if response.status == 304 and etag:
+                        if (data := self.cache.revalidate(route)) is not None:
+                            return data
+
+                        # the cached copy was evicted while we were waiting, fetch it in full
+                        del headers["If-None-Match"]
+                        etag = None
+                        continue
 
                     # Success
                     if 300 > response.status >= 200:
+                        if self.cache is not None and method == "GET":
+                            self.cache.set(route, data, response.headers.get("ETag"))
+                        if self.disk_cache is not None and method == "GET":
+                            self.disk_cache.set(route, data)
+
                         return data
 
-                    if response.status in {500, 502, 504, 524}:
+                    # Rate limited, the limit is shared by the whole app so park every request until it's over
+                    if response.status == 429:
+                        retry_after = float(response.headers.get("Retry-After", 1))
+
+                        if global_over.is_set():
+                            global_over.clear()
+                            try:
+                                await asyncio.sleep(retry_after)
+                            finally:
+                                global_over.set()
+
+                        continue
+
+                    # The token was revoked or expired in flight, refresh it once and try again
+                    if response.status == 401 and not reauthorized:
+                        reauthorized = True
+
+                        await auth._refresh(stale=token)
+                        token = await auth._get_access_token()
+                        headers["Authorization"] = f"Bearer {token}"
+                        continue
+
+                    if response.status in {500, 502, 504, 524} and idempotent:
                         await asyncio.sleep(1 + tries * 2)
                         continue
 
@@ -101,11 +324,31 @@ class HTTPClient:
 
             except OSError as e:
                 # Connection reset by peer
-                if tries < 4 and e.errno in (54, 10054):
+                if tries < 4 and idempotent and e.errno in (54, 10054):
                     await asyncio.sleep(1 + tries * 2)
                     continue
                 raise
 
+        # We've run out of retries
+        if response.status >= 500:
+            raise ServerError(response, data)
+
+        raise HTTPException(response, data)
+
+    async def _decode(self, body: bytes) -> Any:
+        if self.decode_threshold is not None and len(body) >= self.decode_threshold:
+            return await self.loop.run_in_executor(self.decode_executor, orjson.loads, body)
+
+        return orjson.loads(body)
+
+    def _get_global_over(self, auth: AuthorizationFlow) -> asyncio.Event:
+        try:
+            return self._global_over[auth]
+        except KeyError:
+            event = self._global_over[auth] = asyncio.Event()
+            event.set()
+            return event
+
     async def prepare(self):
         if self.connector is None:
             self.connector = aiohttp.TCPConnector(limit=None)
@@ -117,6 +360,10 @@ class HTTPClient:
     async def close(self):
         await self.__session.close()
 
+        if self.disk_cache is not None:
+            await self.disk_cache.close()
+        await self.auth.close()
+
     async def fetch_me(self) -> ClientUserPayload:
         route = Route("GET", "/me")
         return await self.request(route)
@@ -125,22 +372,29 @@ class HTTPClient:
 
     async def get_album(self, album_id: SpotifyID) -> AlbumPayload:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-an-album"""
-        route = Route("GET", f"/albums/{album_id}")
+        if self._album_loader is not None:
+            return await self._album_loader.load(album_id)
+
+        return await self._get_album(album_id)
+
+    async def _get_album(self, album_id: SpotifyID) -> AlbumPayload:
+        route = Route("GET", "/albums/{album_id}", album_id=album_id)
         return await self.request(route)
 
     async def get_albums(self, album_ids: List[SpotifyID]) -> List[AlbumPayload]:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-multiple-albums"""
-        route = Route("GET", "/albums", ids=",".join(album_ids))
-        data = await self.request(route)
-        return data["albums"]
+        return await self._get_many("/albums", "album_id", "albums", album_ids)
 
     async def get_album_tracks(self, album_id: SpotifyID, **kwargs) -> PaginatedPayload[TrackPayload]:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-an-albums-tracks"""
-        route = Route("GET", f"/albums/{album_id}/tracks", **kwargs)
+        route = Route("GET", "/albums/{album_id}/tracks", album_id=album_id, **kwargs)
         return await self.request(route)
 
-    async def get_me_albums(self, **kwargs) -> PaginatedPayload[ListAlbumPayload]:
+    async def get_me_albums(self, market: Optional[str] = None, **kwargs) -> PaginatedPayload[ListAlbumPayload]:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-users-saved-albums"""
+        if market:
+            kwargs["market"] = market
+
         route = Route("GET", "/me/albums", **kwargs)
         return await self.request(route)
 
@@ -172,31 +426,35 @@ class HTTPClient:
 
     async def get_artist(self, artist_id: SpotifyID) -> ArtistPayload:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-an-artist"""
-        route = Route("GET", f"/artists/{artist_id}")
+        if self._artist_loader is not None:
+            return await self._artist_loader.load(artist_id)
+
+        return await self._get_artist(artist_id)
+
+    async def _get_artist(self, artist_id: SpotifyID) -> ArtistPayload:
+        route = Route("GET", "/artists/{artist_id}", artist_id=artist_id)
         return await self.request(route)
 
     async def get_artists(self, artist_ids: List[SpotifyID]) -> List[ArtistPayload]:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-multiple-artists"""
-        route = Route("GET", "/artists", ids=",".join(artist_ids))
-        data = await self.request(route)
-        return data["artists"]
+        return await self._get_many("/artists", "artist_id", "artists", artist_ids)
 
     async def get_artist_albums(
         self, artist_id: SpotifyID, include: List[str] = [], **kwargs
     ) -> PaginatedPayload[AlbumPayload]:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-an-artists-albums"""
-        route = Route("GET", f"/artists/{artist_id}/albums", include_groups=include, **kwargs)
+        route = Route("GET", "/artists/{artist_id}/albums", artist_id=artist_id, include_groups=include, **kwargs)
         return await self.request(route)
 
     async def get_artist_top_tracks(self, artist_id: SpotifyID, *, country_code: str) -> List[TrackPayload]:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-an-artists-top-tracks"""
-        route = Route("GET", f"/artists/{artist_id}/top-tracks", country=country_code)
+        route = Route("GET", "/artists/{artist_id}/top-tracks", artist_id=artist_id, country=country_code)
         data = await self.request(route)
         return data["tracks"]
 
     async def get_artist_related(self, artist_id: SpotifyID) -> List[ArtistPayload]:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-an-artists-related-artists"""
-        route = Route("GET", f"/artists/{artist_id}/related-artists")
+        route = Route("GET", "/artists/{artist_id}/related-artists", artist_id=artist_id)
         data = await self.request(route)
         return data["artists"]
 
@@ -204,20 +462,24 @@ class HTTPClient:
 
     async def get_track(self, track_id: SpotifyID) -> TrackPayload:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-track"""
-        route = Route("GET", f"/tracks/{track_id}")
+        if self._track_loader is not None:
+            return await self._track_loader.load(track_id)
+
+        return await self._get_track(track_id)
+
+    async def _get_track(self, track_id: SpotifyID) -> TrackPayload:
+        route = Route("GET", "/tracks/{track_id}", track_id=track_id)
         return await self.request(route)
 
     async def get_tracks(self, track_ids: List[SpotifyID]) -> List[TrackPayload]:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-several-tracks"""
-        route = Route("GET", "/tracks", ids=",".join(track_ids))
-        data = await self.request(route)
-        return data["tracks"]
+        return await self._get_many("/tracks", "track_id", "tracks", track_ids)
 
     # Playlists
 
     async def get_playlist(self, playlist_id: SpotifyID) -> PlaylistPayload:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-playlist"""
-        route = Route("GET", f"/playlists/{playlist_id}")
+        route = Route("GET", "/playlists/{playlist_id}", playlist_id=playlist_id)
         return await self.request(route)
 
     async def put_playlist(
@@ -241,12 +503,12 @@ class HTTPClient:
         if collaborative:
             data["collaborative"] = collaborative
 
-        route = Route("PUT", f"/playlists/{playlist_id}")
+        route = Route("PUT", "/playlists/{playlist_id}", playlist_id=playlist_id)
         await self.request(route, json=data)
 
     async def get_playlist_tracks(self, playlist_id: SpotifyID, **kwargs) -> PaginatedPayload[TrackPayload]:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-playlists-tracks"""
-        route = Route("GET", f"/playlists/{playlist_id}/tracks", **kwargs)
+        route = Route("GET", "/playlists/{playlist_id}/tracks", playlist_id=playlist_id, **kwargs)
         return await self.request(route)
 
     async def post_playlist_tracks(self, playlist_id: SpotifyID, *, uris: List[SpotifyURI], position: int) -> SnapshotID:
@@ -258,7 +520,7 @@ class HTTPClient:
         if position is not None:
             query["position"] = position
 
-        route = Route("POST", f"/playlists/{playlist_id}/tracks", **query)
+        route = Route("POST", "/playlists/{playlist_id}/tracks", playlist_id=playlist_id, **query)
         data = await self.request(route)
         return data["snapshot_id"]
 
@@ -279,7 +541,7 @@ class HTTPClient:
         self, playlist_id: SpotifyID, *, uris: List[SpotifyURI], snapshot_id: SnapshotID
     ) -> SnapshotID:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/remove-tracks-playlist"""
-        route = Route("DELETE", f"/playlists/{playlist_id}/tracks")
+        route = Route("DELETE", "/playlists/{playlist_id}/tracks", playlist_id=playlist_id)
         data = await self.request(
             route,
             json={
@@ -296,7 +558,7 @@ class HTTPClient:
 
     async def get_user_playlists(self, user_id: SpotifyUserID, **kwargs) -> PaginatedPayload[PlaylistPayload]:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/get-list-users-playlists"""
-        route = Route("GET", f"/users/{user_id}/playlists", **kwargs)
+        route = Route("GET", "/users/{user_id}/playlists", user_id=user_id, **kwargs)
         return await self.request(route)
 
     async def post_user_playlists(
@@ -318,7 +580,7 @@ class HTTPClient:
         if description:
             data["description"] = description
 
-        route = Route("POST", f"/users/{user_id}/playlists")
+        route = Route("POST", "/users/{user_id}/playlists", user_id=user_id)
         return await self.request(route, json=data)
 
     async def get_browse_featured_playlists(self, *, country_code: str, **kwargs) -> PaginatedPayload[PlaylistPayload]:
@@ -337,11 +599,11 @@ class HTTPClient:
         if country_code:
             kwargs["country"] = country_code
 
-        route = Route("GET", f"/browse/categories/{category}/playlists", **kwargs)
+        route = Route("GET", "/browse/categories/{category}/playlists", category=category, **kwargs)
         data = await self.request(route)
         return data["playlists"]
 
     async def put_playlist_image(self, playlist_id: SpotifyID, *, image: bytes) -> None:
         """https://developer.spotify.com/documentation/web-api/reference/#/operations/upload-custom-playlist-cover"""
-        route = Route("PUT", f"/playlists/{playlist_id}/images")
+        route = Route("PUT", "/playlists/{playlist_id}/images", playlist_id=playlist_id)
         await self.request(route, data=b64encode(image))
@@ -1,4 +1,13 @@
-from typing import AsyncIterator, List, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, List, Optional, TypeVar, Union
+
+from .utils.chunked import Batched
+from .utils.paginator import Paginator
+
+if TYPE_CHECKING:
+    from .state import State
+    from .types import PaginatedPayload
+
+__all__ = ("GenericAsyncIterator", "PaginatedAsyncIterator", "Batched")
 
 T = TypeVar("T")
 
@@ -13,15 +22,170 @@ class GenericAsyncIterator(AsyncIterator[T]):
         return self.iterator
 
     async def __anext__(self) -> T:
-        return await self.iterator.next()
+        return await self.iterator.__anext__()
 
     async def flatten(self, *, limit: Optional[int] = None) -> List[T]:
         ret = []
 
+        if limit is not None and limit <= 0:
+            return ret
+
         async for item in self:
+            ret.append(item)
+
+            # stop before asking for an item we won't use
             if limit is not None and len(ret) >= limit:
                 break
 
-            ret.append(item)
-
         return ret
+
+    def take(self, n: int) -> "GenericAsyncIterator[T]":
+        """An asynchronous iterator over at most the next ``n`` items."""
+
+        async def gen():
+            if n <= 0:
+                return
+
+            count = 0
+            async for item in self:
+                yield item
+
+                count += 1
+                if count >= n:
+                    return
+
+        return GenericAsyncIterator(gen())
+
+
+class PaginatedAsyncIterator(GenericAsyncIterator[T]):
+    """An asynchronous iterator over a paginated collection.
+
+    Iterating it yields one object at a time, :meth:`pages` yields whole pages.
+    Both read from the same cursor, so each item is only returned once.
+    In raw mode the payload dicts are yielded instead of objects.
+    """
+
+    __slots__ = ("_state", "_raw", "_paginator")
+
+    def __init__(
+        self,
+        state: "State",
+        func: Callable[..., Awaitable["PaginatedPayload"]],
+        *args: Any,
+        raw: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._state = state
+        self._raw = raw
+        self._paginator = Paginator(func, *args, prefetch=state.page_prefetch, **kwargs)
+
+        super().__init__(self._items())
+
+    async def _items(self) -> AsyncIterator[T]:
+        paginator = self._paginator
+        objectify = self._state.objectify
+        raw = self._state.raw if self._raw is None else self._raw
+
+        # item by item, so the paginator's count is exactly what has been yielded
+        while True:
+            try:
+                data = await paginator.__anext__()
+            except StopAsyncIteration:
+                return
+
+            yield data if raw else objectify(data)
+
+    async def flatten(self, *, limit: Optional[int] = None) -> List[T]:
+        """Collects the remaining items, or only the next ``limit`` of them.
+
+        Pages are only requested up to the ``limit``\th item, iterating on afterwards picks up
+        where this left off.
+        """
+        if limit is None:
+            return await super().flatten()
+
+        with self._paginator.limited(limit):
+            return await super().flatten(limit=limit)
+
+    async def count(self) -> int:
+        """Returns the number of items in the collection.
+
+        Free if the total came with the parent object, like a playlist's tracks, or a page was already
+        read. Otherwise a single item is requested to find it out, and the result is kept.
+
+        Returns:
+            :class:`int`: The total number of items, regardless of any limit.
+        """
+        return await self._paginator.total()
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Awaitable[T], GenericAsyncIterator[T]]:
+        """Random access into the collection, without moving the cursor.
+
+        ``await iterator[i]`` returns a single item, ``iterator[a:b:c]`` is an asynchronous iterator over a
+        slice. Only the pages holding the wanted items are requested, up to four at once, or up to
+        ``page_prefetch`` if that's higher. Negative indices and steps work like for a list, finding out the total first if needed.
+
+        Raises:
+            IndexError: The index is out of range, raised when awaited.
+        """
+        if isinstance(index, slice):
+            return GenericAsyncIterator(self._slice(index))
+
+        return self._item_at(index)
+
+    async def _slice(self, indices: slice) -> AsyncIterator[T]:
+        objectify = self._state.objectify
+        raw = self._state.raw if self._raw is None else self._raw
+
+        async for page in self._paginator.pages_at(indices):
+            for data in page:
+                yield data if raw else objectify(data)
+
+    async def _item_at(self, index: int) -> T:
+        async for item in self._slice(slice(index, index + 1 or None)):
+            return item
+
+        raise IndexError("collection index out of range")
+
+    def reversed(self) -> GenericAsyncIterator[T]:
+        """An asynchronous iterator over the collection from the last item to the first.
+
+        The cursor isn't moved, pages are requested from the end. To only read the last ``n`` items,
+        slice them instead, as in ``iterator[:-n - 1:-1]``.
+        """
+        return self[::-1]
+
+    def take(self, n: int) -> GenericAsyncIterator[T]:
+        """An asynchronous iterator over at most the next ``n`` items.
+
+        Pages are only requested up to the ``n``\th item, rather than in full. This iterator
+        isn't capped, iterating on afterwards picks up where the taken items left off.
+        """
+        paginator = self._paginator
+
+        async def gen():
+            stop = paginator.count + n
+
+            # the limit is only applied while an item is fetched, never while one is yielded
+            while paginator.count < stop:
+                with paginator.limited(stop - paginator.count):
+                    try:
+                        item = await self.__anext__()
+                    except StopAsyncIteration:
+                        return
+
+                yield item
+
+        return GenericAsyncIterator(gen())
+
+    async def pages(self) -> AsyncIterator[List[T]]:
+        """An asynchronous iterator over the collection a page at a time.
+
+        Yields:
+            List: The objects on the next page.
+        """
+        objectify = self._state.objectify
+        raw = self._state.raw if self._raw is None else self._raw
+
+        async for page in self._paginator.pages():
+            yield page if raw else [objectify(data) for data in page]
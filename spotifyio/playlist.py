@@ -1,13 +1,14 @@
-from typing import TYPE_CHECKING, Iterable, List
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
-from .asset import Asset
-from .iterators import GenericAsyncIterator
+from .endpoints import ENDPOINTS
+from .iterators import PaginatedAsyncIterator
 from .mixins import Followable, Url
 from .types import SpotifyID, SpotifyURI
-from .utils.chunked import Chunked
-from .utils.paginator import Paginator
+from .utils.chunked import Chunked, batched
+from .utils.lazy import build_assets, build_object, lazy
 
 if TYPE_CHECKING:
+    from .asset import Asset
     from .state import State
     from .track import ListTrack, Track
     from .types import PlaylistPayload
@@ -41,8 +42,8 @@ class Playlist(Url, Followable):
         "external_urls",
         "name",
         "description",
-        "images",
-        "owner",
+        "_images",
+        "_owner",
         "primary_color",
         "public",
         "collaborative",
@@ -55,13 +56,14 @@ class Playlist(Url, Followable):
         external_urls: dict
         name: str
         description: str
-        images: List[Asset]
-        owner: User
         primary_color: str
         public: bool
         collaborative: bool
         snapshot_id: str
 
+    images: "lazy[List[Asset]]" = lazy(build_assets)
+    owner: "lazy[User]" = lazy(build_object)
+
     def __init__(self, state, data: "PlaylistPayload") -> None:
         self._state: State = state
         self._update(data)
@@ -72,8 +74,8 @@ class Playlist(Url, Followable):
         self.external_urls = data["external_urls"]
         self.name = data["name"]
         self.description = data["description"]
-        self.images = [Asset(**a) for a in data["images"]]
-        self.owner = self._state.objectify(data["owner"])
+        self.images = data["images"]
+        self.owner = data["owner"]
         self.primary_color = data["primary_color"]
         self.public = data["public"]
         self.collaborative = data["collaborative"]
@@ -105,33 +107,40 @@ class Playlist(Url, Followable):
             collaborative=collaborative,
         )
 
-    def tracks(self) -> GenericAsyncIterator["ListTrack"]:
+    def tracks(self, raw: Optional[bool] = None) -> PaginatedAsyncIterator["ListTrack"]:
         """An asynchronous iterator for the playlist Tracks.
 
+        Args:
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
+
         Yields:
             :class:`.Track`:.
         """
 
-        async def gen():
-            async for data in Paginator(self._state.http.get_playlist_tracks, self.id, _data=self._tracks):
-                yield self._state.objectify(data)
-
-        return GenericAsyncIterator(gen())
+        return PaginatedAsyncIterator(
+            self._state,
+            self._state.http.get_playlist_tracks,
+            self.id,
+            _data=self._tracks,
+            page_size=ENDPOINTS["get_playlist_tracks"].max_page,
+            raw=raw,
+        )
 
     async def add(self, *tracks: Iterable["Track"], position: int = None) -> None:
         """Add a track to this playlist.
 
         Args:
-            \*tracks (:class:`.Track`): Argument list of tracks.
+            \*tracks (:class:`.Track`): Argument list of tracks, or a single iterable, async iterable or
+                :class:`.Batched` of them.
             position (Optional[:class:`int`]): The position to insert the track(s). Defaults to None.
         """
-        for chunk in Chunked(tracks, 100):
+        async for chunk in batched(tracks, ENDPOINTS["post_playlist_tracks"].max_ids):
             self.snapshot_id = await self._state.http.post_playlist_tracks(
                 self.id, uris=list(map(lambda x: x.uri, chunk)), position=position
             )
 
     async def update(self, *tracks: Iterable["Track"]) -> None:
-        for chunk in Chunked(tracks, 20):
+        async for chunk in batched(tracks, ENDPOINTS["put_playlist_tracks"].max_ids):
             await self._state.http.put_playlist_tracks(list(map(lambda x: x.id, chunk)))
 
     async def update_image(self, image: bytes) -> None:
@@ -146,9 +155,10 @@ class Playlist(Url, Followable):
         """Remove tracks from this playlist.
 
         Args:
-            \*tracks (:class:`.Track`): Argument list of tracks.
+            \*tracks (:class:`.Track`): Argument list of tracks, or a single iterable, async iterable or
+                :class:`.Batched` of them.
         """
-        for chunk in Chunked(tracks, 20):
+        async for chunk in batched(tracks, ENDPOINTS["delete_playlist_tracks"].max_ids):
             await self._state.http.delete_playlist_tracks(
                 self.id,
                 uris=list(map(lambda x: x.uri, chunk)),
@@ -0,0 +1,163 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
+
+__all__ = ("RateLimiter", "TokenBucket", "SlidingWindow", "SQLiteTokenBucket")
+
+
+class RateLimiter:
+    """Base class for request governors.
+
+    A governor is acquired once before every request is sent, the same instance
+    can be passed to any number of :class:`.Client` objects to share one budget.
+    """
+
+    async def acquire(self) -> None:
+        raise NotImplementedError()
+
+
+class TokenBucket(RateLimiter):
+    """Allows ``rate`` requests every ``per`` seconds, with bursts of up to ``capacity``.
+
+    Args:
+        rate (:class:`float`): Number of requests allowed per period.
+        per (:class:`float`): Length of the period in seconds. Defaults to 1.
+        capacity (Optional[:class:`float`]): Maximum burst size. Defaults to ``rate``.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.per = per
+        self.capacity = capacity or rate
+
+        self._tokens: float = self.capacity
+        self._updated: float = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # the lock is held while sleeping so waiters are served in order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate / self.per)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+
+class SlidingWindow(RateLimiter):
+    """Allows at most ``requests`` requests in any ``window`` second period.
+
+    Args:
+        requests (:class:`int`): Number of requests allowed in the window.
+        window (:class:`float`): Length of the window in seconds.
+    """
+
+    def __init__(self, requests: int, window: float) -> None:
+        self.requests = requests
+        self.window = window
+
+        self._sent: Deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+
+                while self._sent and self._sent[0] <= now - self.window:
+                    self._sent.popleft()
+
+                if len(self._sent) < self.requests:
+                    self._sent.append(now)
+                    return
+
+                await asyncio.sleep(self._sent[0] + self.window - now)
+
+
+class SQLiteTokenBucket(RateLimiter):
+    """A :class:`.TokenBucket` stored in an SQLite database so that every process
+    on the machine using the same ``path`` and ``name`` shares one budget.
+
+    Args:
+        path (:class:`str`): Path to the database file, created if it doesn't exist.
+        rate (:class:`float`): Number of requests allowed per period.
+        per (:class:`float`): Length of the period in seconds. Defaults to 1.
+        capacity (Optional[:class:`float`]): Maximum burst size. Defaults to ``rate``.
+        name (:class:`str`): Name of the bucket, allows several budgets in one database.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rate: float,
+        per: float = 1.0,
+        capacity: Optional[float] = None,
+        name: str = "default",
+    ) -> None:
+        self.path = path
+        self.rate = rate
+        self.per = per
+        self.capacity = capacity or rate
+        self.name = name
+
+        self._conn: sqlite3.Connection = None
+        self._conn_lock = threading.Lock()
+        self._lock = asyncio.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL, updated REAL)")
+
+        return self._conn
+
+    def _take(self) -> float:
+        """Takes a token if one is available, otherwise returns how long to wait for one."""
+        with self._conn_lock:
+            conn = self._connect()
+
+            # BEGIN IMMEDIATE takes the database write lock, serializing us with other processes
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+
+                row = conn.execute("SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)).fetchone()
+                if row is None:
+                    tokens = self.capacity
+                else:
+                    tokens = min(self.capacity, row[0] + max(now - row[1], 0) * self.rate / self.per)
+
+                if tokens >= 1:
+                    tokens -= 1
+                    delay = 0.0
+                else:
+                    delay = (1 - tokens) * self.per / self.rate
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)", (self.name, tokens, now)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        return delay
+
+    async def acquire(self) -> None:
+        # like TokenBucket, only one waiter in this process polls the database at a time
+        async with self._lock:
+            while delay := await asyncio.to_thread(self._take):
+                await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,3 +1,6 @@
+from typing import Any, Callable, Optional, Tuple
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
 from .album import Album, ListAlbum
 from .artist import Artist
 from .http import HTTPClient
@@ -16,11 +19,43 @@ OBJ_MAPPING = {
 }
 
 
+def _identity(data: dict) -> dict:
+    return data
+
+
 class State:
-    __slots__ = ("http",)
+    __slots__ = ("http", "page_prefetch", "lazy", "raw", "_objects", "_richness")
 
-    def __init__(self, http: HTTPClient) -> None:
+    def __init__(
+        self,
+        http: HTTPClient,
+        page_prefetch: int = 0,
+        identity_map: bool = False,
+        lazy: bool = False,
+        raw: bool = False,
+    ) -> None:
         self.http = http
+        self.page_prefetch = page_prefetch
+        self.lazy = lazy
+        self.raw = raw
+
+        # one live object per (type, id), updated in place when a fuller payload comes along
+        self._objects: Optional[WeakValueDictionary[Tuple[str, str], object]] = None
+        self._richness: Optional[WeakKeyDictionary[object, int]] = None
+
+        if identity_map:
+            self._objects = WeakValueDictionary()
+            self._richness = WeakKeyDictionary()
+
+    def objectifier(self, raw: Optional[bool] = None) -> Callable[[dict], Any]:
+        """Returns :meth:`objectify`, or a function returning payloads as is in raw mode.
+
+        ``raw`` overrides the state's own setting unless it is ``None``.
+        """
+        if self.raw if raw is None else raw:
+            return _identity
+
+        return self.objectify
 
     def objectify(self, data: dict):
 
@@ -37,4 +72,20 @@ class State:
         if _type not in OBJ_MAPPING:
             raise NotImplementedError(f"{_type} not supported in State.objectify")
 
-        return OBJ_MAPPING[_type](self, data)
+        # listings carry their own added_at, local tracks have no id
+        if self._objects is None or _type.startswith("list_") or data.get("id") is None:
+            return OBJ_MAPPING[_type](self, data)
+
+        key = (_type, data["id"])
+
+        obj = self._objects.get(key)
+        if obj is None:
+            obj = self._objects[key] = OBJ_MAPPING[_type](self, data)
+            self._richness[obj] = len(data)
+
+        # simplified payloads have fewer fields, don't let them overwrite a full one
+        elif len(data) >= self._richness[obj]:
+            obj._update(data)
+            self._richness[obj] = len(data)
+
+        return obj
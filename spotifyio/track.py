@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, List
 
 from .mixins import Url
 from .types import SpotifyID, SpotifyURI
+from .utils.lazy import build_object, build_objects, lazy
 from .utils.time import fromspotifyiso
 
 if TYPE_CHECKING:
@@ -42,8 +43,8 @@ class Track(Url):
         "uri",
         "external_urls",
         "name",
-        "album",
-        "artists",
+        "_album",
+        "_artists",
         "markets",
         "disc_number",
         "duration",
@@ -60,14 +61,15 @@ class Track(Url):
         uri: SpotifyURI
         external_urls: dict
         name: str
-        album: Album
-        artists: List[Artist]
         markets: List[str]
         local: bool
         popularity: int
         preview_url: str
         track_number: int
 
+    album: "lazy[Album]" = lazy(build_object)
+    artists: "lazy[List[Artist]]" = lazy(build_objects)
+
     def __init__(self, state, data: "TrackPayload") -> None:
         self._state: State = state
         self._update(data)
@@ -77,15 +79,12 @@ class Track(Url):
         self.uri = data["uri"]
         self.external_urls = data["external_urls"]
         self.name = data["name"]
-        self.artists = [self._state.objectify(a) for a in data["artists"]]
+        self.artists = data["artists"]
         self.local = data["is_local"]
         self.preview_url = data["preview_url"]
         self.track_number = data["track_number"]
 
-        if "album" in data:
-            self.album = self._state.objectify(data["album"])
-        else:
-            self.album = None
+        self.album = data.get("album")
 
         self.markets = data.get("available_markets")
         self.popularity = data.get("popularity")
@@ -109,19 +108,17 @@ class ListTrack(Track):
 
     __slots__ = (
         "added_at",
-        "added_by",
+        "_added_by",
     )
 
     if TYPE_CHECKING:
         added_at: datetime
-        added_by: User
+
+    added_by: "lazy[User]" = lazy(build_object)
 
     def __init__(self, state, data: "ListTrackPayload") -> None:
         super().__init__(state, data["track"])
 
         self.added_at = fromspotifyiso(data["added_at"])
 
-        if "added_by" in data:
-            self.added_by = self._state.objectify(data["added_by"])
-        else:
-            self.added_by = None
+        self.added_by = data.get("added_by")
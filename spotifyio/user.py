@@ -1,37 +1,33 @@
 from typing import TYPE_CHECKING, Iterable, List, Optional
 
-from .asset import Asset
-from .iterators import GenericAsyncIterator
+from .endpoints import ENDPOINTS
+from .iterators import PaginatedAsyncIterator
 from .mixins import Followable, Url
 from .types import SpotifyURI, SpotifyUserID
 from .utils.chunked import Chunked
-from .utils.paginator import Paginator
+from .utils.lazy import build_assets, lazy
 
 if TYPE_CHECKING:
     from .album import Album
     from .artist import Artist
+    from .asset import Asset
     from .playlist import Playlist
     from .state import State
     from .track import ListTrack, Track
     from .types import ClientUserPayload, UserPayload
 
 
-class ClientUserAlbums(GenericAsyncIterator["Album"]):
-    def __init__(self, state, *args, **kwargs) -> None:
-        self._state: State = state
-
-        super().__init__(*args, **kwargs)
-
+class ClientUserAlbums(PaginatedAsyncIterator["Album"]):
     async def save(self, *albums: Iterable["Album"]) -> None:
-        for chunk in Chunked(albums, 20):
+        for chunk in Chunked(albums, ENDPOINTS["put_me_albums"].max_ids):
             await self._state.http.put_me_albums(list(map(lambda x: x.id, chunk)))
 
     async def remove(self, *albums: Iterable["Album"]) -> None:
-        for chunk in Chunked(albums, 20):
+        for chunk in Chunked(albums, ENDPOINTS["delete_me_albums"].max_ids):
             await self._state.http.delete_me_albums(list(map(lambda x: x.id, chunk)))
 
     async def contains(self, *albums: Iterable["Album"]) -> List[bool]:
-        for chunk in Chunked(albums, 20):
+        for chunk in Chunked(albums, ENDPOINTS["get_me_albums_contains"].max_ids):
             return await self._state.http.get_me_albums_contains(list(map(lambda x: x.id, chunk)))
 
 
@@ -54,7 +50,7 @@ class User(Url, Followable):
         "uri",
         "external_urls",
         "display_name",
-        "images",
+        "_images",
     )
 
     if TYPE_CHECKING:
@@ -62,7 +58,8 @@ class User(Url, Followable):
         uri: SpotifyURI
         external_urls: dict
         display_name: str
-        images: List[Asset]
+
+    images: "lazy[List[Asset]]" = lazy(build_assets)
 
     def __init__(self, state, data: "UserPayload") -> None:
         self._state: State = state
@@ -76,23 +73,25 @@ class User(Url, Followable):
         self.display_name = data.get("display_name")
         self._followers = data.get("followers")
 
-        if "images" in data:
-            self.images = [Asset(**a) for a in data["images"]]
-        else:
-            self.images = None
+        self.images = data.get("images")
 
-    def playlists(self) -> GenericAsyncIterator["Playlist"]:
+    def playlists(self, raw: Optional[bool] = None) -> PaginatedAsyncIterator["Playlist"]:
         """An asynchronous iterator for the users's saved playlists.
 
+        Args:
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
+
         Yields:
             :class:`.Playlist`:
         """
 
-        async def gen():
-            async for data in Paginator(self._state.http.get_user_playlists, self.id):
-                yield self._state.objectify(data)
-
-        return GenericAsyncIterator(gen())
+        return PaginatedAsyncIterator(
+            self._state,
+            self._state.http.get_user_playlists,
+            self.id,
+            page_size=ENDPOINTS["get_user_playlists"].max_page,
+            raw=raw,
+        )
 
     def __repr__(self) -> str:
         attrs = " ".join(f"{name}={getattr(self, name)}" for name in ["id", "display_name"])
@@ -130,25 +129,30 @@ class ClientUser(User):
         self.product = data.get("product")  # user-read-private
         self.explicit_content = data.get("explicit_content")  # user-read-private
 
-    def albums(self, market: str = None) -> ClientUserAlbums["Album"]:
+    def albums(self, market: str = None, raw: Optional[bool] = None) -> ClientUserAlbums["Album"]:
         """An asynchronous iterator for the users's saved albums.
 
+        Args:
+            market (Optional[:class:`str`]): An ISO 3166-1 alpha-2 country code, only albums available
+                there are returned. Defaults to ``None``.
+            raw (Optional[:class:`bool`]): Yield payload dicts instead of objects. Defaults to the client's ``raw`` option.
+
         Yields:
             :class:`.Album`:
         """
 
-        async def gen():
-            async for data in Paginator(self._state.http.get_me_albums):
-                yield self._state.objectify(data)
-
-        return ClientUserAlbums(self._state, gen())
-
-    def playlists(self) -> GenericAsyncIterator["Playlist"]:
-        async def gen():
-            async for data in Paginator(self._state.http.get_me_playlists):
-                yield self._state.objectify(data)
+        return ClientUserAlbums(
+            self._state,
+            self._state.http.get_me_albums,
+            market=market,
+            page_size=ENDPOINTS["get_me_albums"].max_page,
+            raw=raw,
+        )
 
-        return GenericAsyncIterator(gen())
+    def playlists(self, raw: Optional[bool] = None) -> PaginatedAsyncIterator["Playlist"]:
+        return PaginatedAsyncIterator(
+            self._state, self._state.http.get_me_playlists, page_size=ENDPOINTS["get_me_playlists"].max_page, raw=raw
+        )
 
     async def create_playlist(
         self,
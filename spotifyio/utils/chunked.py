@@ -1,4 +1,8 @@
-from typing import Generic, Iterable, Iterator, TypeVar
+import asyncio
+from itertools import islice
+from typing import AsyncIterable, AsyncIterator, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from .concurrency import next_item
 
 T = TypeVar("T")
 
@@ -15,3 +19,113 @@ class Chunked(Generic[T]):
     def __next__(self):
         i = next(self.range)
         return self.data[i : i + self.chunk_size]
+
+
+class Batched(Generic[T]):
+    """Groups a synchronous or asynchronous iterable into lists of up to ``size`` items.
+
+    The iterable is read lazily, one batch at a time, so it never has to fit in memory.
+
+    Args:
+        iterable (Union[Iterable, AsyncIterable]): The items to batch.
+        size (:class:`int`): Maximum number of items in a batch.
+        timeout (Optional[:class:`float`]): If set, a batch that isn't full is yielded anyway once its
+            first item has waited this many seconds for the rest. Defaults to ``None``.
+    """
+
+    def __init__(self, iterable: Union[Iterable[T], AsyncIterable[T]], size: int, timeout: Optional[float] = None) -> None:
+        self.iterable = iterable
+        self.size = size
+        self.timeout = timeout
+
+    def __aiter__(self) -> AsyncIterator[List[T]]:
+        if not isinstance(self.iterable, AsyncIterable):
+            return self._sync_batches()
+
+        if self.timeout is None:
+            return self._async_batches()
+
+        return self._timed_batches()
+
+    async def _sync_batches(self) -> AsyncIterator[List[T]]:
+        iterator = iter(self.iterable)
+
+        while batch := list(islice(iterator, self.size)):
+            yield batch
+
+    async def _async_batches(self) -> AsyncIterator[List[T]]:
+        batch = []
+
+        async for item in self.iterable:
+            batch.append(item)
+
+            if len(batch) >= self.size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    async def _timed_batches(self) -> AsyncIterator[List[T]]:
+        loop = asyncio.get_running_loop()
+        iterator = self.iterable.__aiter__()
+
+        batch = []
+        deadline: Optional[float] = None
+
+        # kept across deadlines, cancelling it could break the iterator
+        pending: Optional[asyncio.Future] = None
+
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(next_item(iterator))
+
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+
+                if not done:
+                    yield batch
+                    batch, deadline = [], None
+                    continue
+
+                more, item = pending.result()
+                pending = None
+
+                if not more:
+                    break
+
+                if not batch:
+                    deadline = loop.time() + self.timeout
+
+                batch.append(item)
+
+                if len(batch) >= self.size:
+                    yield batch
+                    batch, deadline = [], None
+
+            if batch:
+                yield batch
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+def batched(items: Tuple, size: int) -> Batched:
+    """Batches the arguments of a method taking ``*items``.
+
+    A single :class:`Batched` argument is used with its size capped at ``size``, a single iterable or
+    asynchronous iterable argument is streamed in batches of ``size``, anything else is batched as the
+    argument list.
+    """
+    if len(items) == 1:
+        item = items[0]
+
+        if isinstance(item, Batched):
+            return item if item.size <= size else Batched(item.iterable, size, item.timeout)
+
+        if isinstance(item, AsyncIterable) or (isinstance(item, Iterable) and not isinstance(item, str)):
+            return Batched(item, size)
+
+    return Batched(items, size)
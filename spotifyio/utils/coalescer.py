@@ -0,0 +1,109 @@
+import asyncio
+from copy import deepcopy
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Set, TypeVar
+
+from ..exceptions import HTTPException
+from .concurrency import Shared
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class Coalescer(Generic[K, V]):
+    """Collects single lookups into batch calls.
+
+    Keys passed to :meth:`load` within ``delay`` seconds of each other, or until ``max_size``
+    keys are waiting, are sent as one call to ``batch``. Keys the batch can't resolve, or all
+    of them if it was rejected because of a bad key, are retried one at a time with ``single``
+    so the caller gets the same error it would have without coalescing. Any other error is
+    passed on to every caller waiting on the batch. Callers loading the same key each get
+    their own ``copy`` of the value.
+    """
+
+    # statuses a single bad key fails the whole batch with
+    FALLBACK_STATUSES = {400, 404}
+
+    def __init__(
+        self,
+        batch: Callable[[List[K]], Awaitable[List[Optional[V]]]],
+        single: Callable[[K], Awaitable[V]],
+        max_size: int,
+        delay: float,
+        copy: Callable[[V], V] = deepcopy,
+    ) -> None:
+        self._batch = batch
+        self._single = single
+        self.max_size = max_size
+        self.delay = delay
+        self.copy = copy
+
+        self._pending: Dict[K, Shared[V]] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+        # running dispatches, the loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V:
+        shared = self._pending.get(key)
+
+        if shared is None:
+            loop = asyncio.get_running_loop()
+
+            shared = self._pending[key] = Shared(loop.create_future(), self.copy)
+
+            if len(self._pending) >= self.max_size:
+                self._flush()
+            elif self._handle is None:
+                self._handle = loop.call_later(self.delay, self._flush)
+
+        return await shared.wait()
+
+    def _flush(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        pending, self._pending = self._pending, {}
+        self._spawn(self._dispatch({key: shared.future for key, shared in pending.items()}))
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, pending: Dict[K, asyncio.Future]) -> None:
+        try:
+            results = await self._batch(list(pending))
+        except HTTPException as e:
+            if e.status not in self.FALLBACK_STATUSES:
+                # throttling and server errors were already retried, one by one would only add load
+                self._fail(pending, e)
+                return
+
+            # a single bad key fails the whole batch, fall back to fetching one by one
+            results = [None] * len(pending)
+        except BaseException as e:
+            self._fail(pending, e)
+            return
+
+        for (key, future), result in zip(pending.items(), results):
+            if result is None:
+                self._spawn(self._resolve(key, future))
+            elif not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _fail(pending: Dict[K, asyncio.Future], error: BaseException) -> None:
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def _resolve(self, key: K, future: asyncio.Future) -> None:
+        try:
+            result = await self._single(key)
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,169 @@
+import asyncio
+from collections import deque
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Shared(Generic[T]):
+    """A future awaited by several callers, each of which gets its own copy of the result.
+
+    The last caller to resume gets the original, the others copy it before any of them can
+    modify it. Cancelling one caller doesn't cancel the future.
+    """
+
+    __slots__ = ("future", "copy", "waiters")
+
+    def __init__(self, future: asyncio.Future, copy: Callable[[T], T]) -> None:
+        self.future = future
+        self.copy = copy
+        self.waiters = 0
+
+    async def wait(self) -> T:
+        self.waiters += 1
+
+        try:
+            result = await asyncio.shield(self.future)
+        finally:
+            self.waiters -= 1
+
+        return self.copy(result) if self.waiters else result
+
+
+async def next_item(iterator: AsyncIterator[T]) -> Tuple[bool, Optional[T]]:
+    """Awaits the next item, returns ``(False, None)`` instead of raising once the iterator is exhausted.
+
+    StopAsyncIteration can't be passed through a task, so this is what gets wrapped in one.
+    """
+    try:
+        return True, await iterator.__anext__()
+    except StopAsyncIteration:
+        return False, None
+
+
+async def map_concurrent(
+    func: Callable[[T], Awaitable[R]],
+    iterable: Union[Iterable[T], AsyncIterable[T]],
+    limit: int,
+    ordered: bool = True,
+) -> AsyncIterator[R]:
+    """Calls ``func`` on every element with at most ``limit`` calls in flight.
+
+    Results are yielded in input order if ``ordered``, otherwise as soon as they complete.
+    An asynchronous iterable is only read while there is room for another call, and results
+    that are ready are yielded while waiting on it.
+    """
+    if limit < 1:
+        raise ValueError(f"concurrency limit must be at least 1, not {limit}")
+
+    if isinstance(iterable, AsyncIterable):
+        async for result in _map_concurrent_async(func, iterable.__aiter__(), limit, ordered):
+            yield result
+        return
+
+    iterator = iter(iterable)
+
+    # in order, calls are queued and only the oldest one is awaited, otherwise any running call can finish first
+    queue: Deque[asyncio.Future] = deque()
+    running: Set[asyncio.Future] = set()
+
+    def fill() -> None:
+        while len(queue) + len(running) < limit:
+            try:
+                arg = next(iterator)
+            except StopIteration:
+                return
+
+            task = asyncio.ensure_future(func(arg))
+
+            if ordered:
+                queue.append(task)
+            else:
+                running.add(task)
+
+    try:
+        fill()
+
+        while queue or running:
+            if ordered:
+                result = await queue.popleft()
+                fill()
+                yield result
+            else:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                running.difference_update(done)
+                fill()
+
+                for task in done:
+                    yield task.result()
+    finally:
+        for task in (*queue, *running):
+            task.cancel()
+
+
+async def _map_concurrent_async(
+    func: Callable[[T], Awaitable[R]],
+    iterator: AsyncIterator[T],
+    limit: int,
+    ordered: bool,
+) -> AsyncIterator[R]:
+    queue: Deque[asyncio.Future] = deque()
+    running: Set[asyncio.Future] = set()
+
+    # the next element being read from the iterator, only while there is room for another call
+    source: Optional[asyncio.Future] = None
+    exhausted = False
+
+    try:
+        while queue or running or not exhausted:
+            if source is None and not exhausted and len(queue) + len(running) < limit:
+                source = asyncio.ensure_future(next_item(iterator))
+
+            # in order, only the oldest call can be yielded
+            waiting = {queue[0]} if queue else set(running)
+            if source is not None:
+                waiting.add(source)
+
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            if source is not None and source in done:
+                more, arg = source.result()
+                source = None
+
+                if more:
+                    task = asyncio.ensure_future(func(cast(T, arg)))
+
+                    if ordered:
+                        queue.append(task)
+                    else:
+                        running.add(task)
+                else:
+                    exhausted = True
+
+            while queue and queue[0].done():
+                yield queue.popleft().result()
+
+            for task in done & running:
+                running.discard(task)
+                yield task.result()
+    finally:
+        if source is not None:
+            source.cancel()
+
+        for task in (*queue, *running):
+            task.cancel()
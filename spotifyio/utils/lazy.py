@@ -0,0 +1,61 @@
+from typing import Any, Callable, Generic, List, Optional, TypeVar
+
+from ..asset import Asset
+
+T = TypeVar("T")
+
+
+class Pending:
+    """A nested payload that hasn't been turned into objects yet."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+
+
+class lazy(Generic[T]):
+    """A nested field built from its payload by ``build``.
+
+    Assigning the payload stores it in the ``_<name>`` slot. If the owner's state is lazy, the
+    payload is kept as is until the field is first read, otherwise it is built right away.
+    ``None`` is stored as is.
+    """
+
+    __slots__ = ("build", "slot")
+
+    def __init__(self, build: Callable[[Any, Any], T]) -> None:
+        self.build = build
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = f"_{name}"
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> T:
+        if obj is None:
+            return self
+
+        value = getattr(obj, self.slot)
+
+        if type(value) is Pending:
+            value = self.build(obj, value.data)
+            setattr(obj, self.slot, value)
+
+        return value
+
+    def __set__(self, obj: Any, data: Any) -> None:
+        if data is not None:
+            data = Pending(data) if obj._state.lazy else self.build(obj, data)
+
+        setattr(obj, self.slot, data)
+
+
+def build_object(obj: Any, data: dict) -> Any:
+    return obj._state.objectify(data)
+
+
+def build_objects(obj: Any, data: List[dict]) -> List[Any]:
+    return [obj._state.objectify(d) for d in data]
+
+
+def build_assets(obj: Any, data: List[dict]) -> List[Asset]:
+    return [Asset(**a) for a in data]
@@ -1,64 +1,219 @@
-from typing import Awaitable, Callable
+import asyncio
+from collections import deque
+from contextlib import contextmanager
+from typing import AsyncIterator, Awaitable, Callable, Deque, Iterator, List, Tuple
 
 from ..types import PaginatedPayload
+from .concurrency import map_concurrent
 
 
 class Paginator:
-    API_LIMIT = 50  # fingers crossed this is constant....
+    API_LIMIT = 50  # page size when the caller doesn't pass one
+    SLICE_CONCURRENCY = 4  # fewest pages of a slice requested at once
 
     def __init__(self, func: Callable[..., Awaitable[PaginatedPayload]], *args, **kwargs) -> None:
         self._func = func
 
+        # largest page the endpoint allows, from the endpoint registry
+        self._page_size: int = kwargs.pop("page_size", None) or self.API_LIMIT
+
         self._limit: int = kwargs.pop("limit", None)
         self._total: int = float("inf")
 
+        # number of pages to keep in flight ahead of the consumer once the total is known
+        self._prefetch: int = kwargs.pop("prefetch", 0)
+        self._pending: Deque[Tuple[int, asyncio.Future]] = deque()
+
         self.count: int = 0
         self.data: list = []
 
-        if _data := kwargs.get("_data"):
-            self.data = _data["items"]
+        # position of the next item in data, cheaper than popping from the front of the list
+        self._index: int = 0
+
+        # offset of the next page to request
+        self._offset: int = 0
+
+        # the embedded first items, kept for random access after the cursor has moved past them
+        self._head: list = []
+
+        if _data := kwargs.pop("_data", None):
             self._total = _data["total"]
 
+            # simplified objects only embed the total
+            if "items" in _data:
+                self.data = self._head = _data["items"]
+                self._offset = len(self.data)
+
         self._args = args
         self._kwargs = kwargs
 
     def __aiter__(self):
         return self
 
-    async def _make_req(self):
-        kwargs = self._kwargs
+    def __del__(self):
+        self._cancel()
+
+    @property
+    def _end(self) -> int:
+        if self._limit is None:
+            return self._total
+
+        return min(self._total, self._limit)
+
+    async def total(self) -> int:
+        """The number of items in the collection, requests a single item to find out if it isn't known yet."""
+        if self._total == float("inf"):
+            req = await self._func(*self._args, **dict(self._kwargs, limit=1, offset=0))
+            self._total = req["total"]
+
+        return self._total
+
+    async def pages_at(self, indices: slice) -> AsyncIterator[List]:
+        """Yields the items at the slice's indices a page at a time, in the slice's order.
 
-        if not self._limit is None:
-            remaining = self._limit - self.count
+        Only the pages holding those items are requested, as many at once as the paginator
+        prefetches but at least :attr:`SLICE_CONCURRENCY`. Negative indices count from the end,
+        like for a list, and the total is only requested for those or an open ended slice.
+        The cursor isn't moved.
+        """
+        start, stop, step = indices.start or 0, indices.stop, indices.step or 1
 
-        if self._limit is None or remaining > self.API_LIMIT:
-            limit = 50
+        if self._total == float("inf") and stop is not None and start >= 0 and stop >= 0 and step > 0:
+            # a short page marks the end of the collection instead
+            wanted, bounded = range(start, stop, step), False
         else:
-            limit = remaining
+            wanted, bounded = range(await self.total())[indices], True
 
-        kwargs["limit"] = limit
-        kwargs["offset"] = self.count
+        if not wanted:
+            return
 
-        req = await self._func(*self._args, **kwargs)
+        step = abs(wanted.step)
+        per_page = -(-self._page_size // step)
 
-        self._total = req.pop("total")
+        # each page starts at the first wanted index it holds and ends at the last one, a single item
+        # if the step is larger than a page, planned as they are requested since the slice may be huge
+        def plan() -> Iterator[Tuple[int, int]]:
+            rest = wanted if wanted.step > 0 else wanted[::-1]
 
-        self.data = req.pop("items")
+            while rest:
+                if wanted.step > 0:
+                    covered, rest = rest[:per_page], rest[per_page:]
+                else:
+                    covered, rest = rest[-per_page:], rest[:-per_page]
 
-    async def __anext__(self):
-        if self._limit is not None and self.count == self._limit:
-            raise StopAsyncIteration
+                yield covered[0], covered[-1] + 1 - covered[0]
 
-        if self._total == self.count:
-            raise StopAsyncIteration
+        async def fetch(page: Tuple[int, int]) -> Tuple[int, list]:
+            offset, limit = page
+
+            if offset + limit <= len(self._head):
+                return limit, self._head[offset : offset + limit]
+
+            req = await self._func(*self._args, **dict(self._kwargs, limit=limit, offset=offset))
+            return limit, req["items"]
+
+        async for limit, items in map_concurrent(fetch, plan(), max(self._prefetch, self.SLICE_CONCURRENCY)):
+            yield items[::step] if wanted.step > 0 else items[::step][::-1]
+
+            if not bounded and len(items) < limit:
+                return
+
+    def limit_to(self, n: int) -> None:
+        """Stops after ``n`` more items for good, unless an existing limit stops it sooner."""
+        limit = self.count + max(n, 0)
+
+        if self._limit is None or limit < self._limit:
+            self._limit = limit
+
+    @contextmanager
+    def limited(self, n: int) -> Iterator[None]:
+        """Stops after ``n`` more items until the block exits, then the previous limit applies again."""
+        previous = self._limit
+        self.limit_to(n)
+
+        try:
+            yield
+        finally:
+            self._limit = previous
 
-        if not self.data:
+    def _cancel(self) -> None:
+        # the cancelled pages will have to be requested again if iteration goes on
+        if self._pending:
+            self._offset = self._pending[0][0]
+
+        while self._pending:
+            self._pending.popleft()[1].cancel()
+
+    def _request(self) -> Awaitable[PaginatedPayload]:
+        limit = min(self._page_size, self._end - self._offset)
+
+        kwargs = dict(self._kwargs, limit=limit, offset=self._offset)
+        self._offset += limit
+
+        return self._func(*self._args, **kwargs)
+
+    def _schedule(self) -> None:
+        if self._total == float("inf"):
+            return
+
+        while len(self._pending) < self._prefetch and self._offset < self._end:
+            self._pending.append((self._offset, asyncio.ensure_future(self._request())))
+
+    async def _make_req(self):
+        self._schedule()
+
+        if self._pending:
+            req = await self._pending.popleft()[1]
+        else:
+            req = await self._request()
+
+        self._total = req["total"]
+
+        self.data = req["items"]
+        self._index = 0
+
+        self._schedule()
+
+    async def _fill(self) -> bool:
+        """Makes sure there is an unread item in data, returns False once we are out of items."""
+        if (self._limit is not None and self.count >= self._limit) or self._total == self.count:
+            self._cancel()
+            return False
+
+        if self._index >= len(self.data):
             await self._make_req()
 
         # this should never happen
-        if not self.data:
+        if self._index >= len(self.data):
+            self._cancel()
+            return False
+
+        return True
+
+    async def pages(self) -> AsyncIterator[List]:
+        """Yields the remaining items a page at a time."""
+        while await self._fill():
+            end = len(self.data)
+            if self._limit is not None:
+                end = min(end, self._index + self._limit - self.count)
+
+            if self._index == 0 and end == len(self.data):
+                page = self.data
+            else:
+                page = self.data[self._index : end]
+
+            self.count += end - self._index
+            self._index = end
+
+            yield page
+
+    async def __anext__(self):
+        if not await self._fill():
             raise StopAsyncIteration
 
+        item = self.data[self._index]
+
+        self._index += 1
         self.count += 1
 
-        return self.data.pop(0)
+        return item